@@ -63,8 +63,8 @@ class IntervalDict(MutableMapping):
         :return: an IntervalDict
         """
         d = cls()
-        for key, value in items:
-            d._storage[key] = value
+        # Bulk update sorts all keys at once instead of inserting them one by one
+        d._storage.update(items)
 
         return d
 
@@ -263,14 +263,40 @@ class IntervalDict(MutableMapping):
                 new_items.append((i, _how(missing, v, i)))
 
         intersection = dom1 & dom2
-        d1, d2 = self[intersection], other[intersection]
-
-        for i1, v1 in d1.items():
-            for i2, v2 in d2.items():
-                if i1.overlaps(i2):
-                    i = i1 & i2
-                    v = _how(v1, v2, i)
-                    new_items.append((i, v))
+        items1 = list(self[intersection].items())
+        items2 = list(other[intersection].items())
+
+        # Keys of both dicts are disjoint, so are their atomic intervals. Sweep
+        # over them to find overlapping pairs of keys, rather than testing every
+        # pair of keys. Parts of the intersection are grouped by pair of keys.
+        atomics1 = sorted(
+            ((a, k) for k, (i, _) in enumerate(items1) for a in i), key=_sortkey
+        )
+        atomics2 = sorted(
+            ((a, k) for k, (i, _) in enumerate(items2) for a in i), key=_sortkey
+        )
+        pieces = {}
+        n, m = len(atomics1), len(atomics2)
+        x = y = 0
+
+        while x < n and y < m:
+            a1, k1 = atomics1[x]
+            a2, k2 = atomics2[y]
+
+            piece = a1 & a2
+            if not piece.empty:
+                pieces.setdefault((k1, k2), []).append(piece)
+
+            # Advance the atomic interval that ends first
+            if a1.upper < a2.upper or (a1.upper == a2.upper and a1.right is Bound.OPEN):
+                x += 1
+            else:
+                y += 1
+
+        for k1, k2 in sorted(pieces):
+            i = self._klass(*pieces[k1, k2])
+            v = _how(items1[k1][1], items2[k2][1], i)
+            new_items.append((i, v))
 
         return self.__class__(new_items)
 
@@ -1,8 +1,8 @@
 import operator
-from functools import partial
+from functools import lru_cache, partial
 
 from .const import Bound, inf
-from .interval import Interval
+from .interval import _INTERNABLE_TYPES, Interval
 
 
 def open(lower, upper, *, klass=Interval):
@@ -14,7 +14,7 @@ def open(lower, upper, *, klass=Interval):
     :param klass: class to use for creating intervals (default to Interval).
     :return: an interval.
     """
-    return klass.from_atomic(Bound.OPEN, lower, upper, Bound.OPEN)
+    return _from_atomic(Bound.OPEN, lower, upper, Bound.OPEN, klass)
 
 
 def closed(lower, upper, *, klass=Interval):
@@ -26,7 +26,7 @@ def closed(lower, upper, *, klass=Interval):
     :param klass: class to use for creating intervals (default to Interval).
     :return: an interval.
     """
-    return klass.from_atomic(Bound.CLOSED, lower, upper, Bound.CLOSED)
+    return _from_atomic(Bound.CLOSED, lower, upper, Bound.CLOSED, klass)
 
 
 def openclosed(lower, upper, *, klass=Interval):
@@ -38,7 +38,7 @@ def openclosed(lower, upper, *, klass=Interval):
     :param klass: class to use for creating intervals (default to Interval).
     :return: an interval.
     """
-    return klass.from_atomic(Bound.OPEN, lower, upper, Bound.CLOSED)
+    return _from_atomic(Bound.OPEN, lower, upper, Bound.CLOSED, klass)
 
 
 def closedopen(lower, upper, *, klass=Interval):
@@ -50,7 +50,7 @@ def closedopen(lower, upper, *, klass=Interval):
     :param klass: class to use for creating intervals (default to Interval).
     :return: an interval.
     """
-    return klass.from_atomic(Bound.CLOSED, lower, upper, Bound.OPEN)
+    return _from_atomic(Bound.CLOSED, lower, upper, Bound.OPEN, klass)
 
 
 def singleton(value, *, klass=Interval):
@@ -61,7 +61,29 @@ def singleton(value, *, klass=Interval):
     :param klass: class to use for creating intervals (default to Interval).
     :return: an interval.
     """
-    return klass.from_atomic(Bound.CLOSED, value, value, Bound.CLOSED)
+    return _from_atomic(Bound.CLOSED, value, value, Bound.CLOSED, klass)
+
+
+def _from_atomic(left, lower, upper, right, klass):
+    if (
+        klass is Interval
+        and type(lower) in _INTERNABLE_TYPES
+        and type(upper) in _INTERNABLE_TYPES
+    ):
+        return _cached_from_atomic(left, lower, upper, right)
+    return klass.from_atomic(left, lower, upper, right)
+
+
+@lru_cache(maxsize=4096)
+def _cached_from_atomic(left, lower, upper, right):
+    # Intervals are immutable, so intervals on values that cannot be told
+    # apart from equal ones (e.g., integers) can be shared. This is restricted
+    # to Interval, as instances of subclasses can hold other attributes.
+    return Interval.from_atomic(left, lower, upper, right)
+
+
+# Intervals are immutable, so a single empty Interval is enough
+_EMPTY = Interval()
 
 
 def empty(*, klass=Interval):
@@ -71,7 +93,7 @@ def empty(*, klass=Interval):
     :param klass: class to use for creating intervals (default to Interval).
     :return: an interval.
     """
-    return klass()
+    return _EMPTY if klass is Interval else klass()
 
 
 def iterate(interval, step, *, base=None, reverse=False):
@@ -1,10 +1,42 @@
+import copyreg
+import functools
 import warnings
 from collections import namedtuple
 
-from .const import Bound, inf
+from .const import Bound, _NInf, _PInf, inf
 
 Atomic = namedtuple("Atomic", ["left", "lower", "upper", "right"])
 
+# Types for which two equal values are indistinguishable, so that atomic intervals
+# whose bounds are of these types can be safely shared.
+_INTERNABLE_TYPES = frozenset([int, _PInf, _NInf])
+
+
+@functools.lru_cache(maxsize=4096)
+def _interned_atomic(left, lower, upper, right):
+    return Atomic(left, lower, upper, right)
+
+
+def _make_atomic(left, lower, upper, right):
+    """
+    Create an atomic interval. If both bounds are integers or infinities, a
+    previously created (and equal) atomic interval is returned when possible.
+
+    :param left: either CLOSED or OPEN.
+    :param lower: value of the lower bound.
+    :param upper: value of the upper bound.
+    :param right: either CLOSED or OPEN.
+    :return: an atomic interval.
+    """
+    if type(lower) in _INTERNABLE_TYPES and type(upper) in _INTERNABLE_TYPES:
+        return _interned_atomic(left, lower, upper, right)
+    return Atomic(left, lower, upper, right)
+
+
+def _sort_key(atomic):
+    # Sort by lower bound, closed first
+    return (atomic.lower, atomic.left is Bound.OPEN)
+
 
 def mergeable(a, b):
     """
@@ -28,10 +60,11 @@ class Interval:
 
     An interval is an (automatically simplified) union of atomic intervals.
     It can be created with Interval.from_atomic(...) or by passing Interval
-    instances to __init__.
+    instances to __init__. Interval instances are immutable, and can therefore
+    be shared (e.g., an operation can return one of its operands).
     """
 
-    __slots__ = ("_intervals",)
+    __slots__ = ("_intervals", "_hash")
     __match_args__ = ("left", "lower", "upper", "right")
 
     def __init__(self, *intervals):
@@ -41,6 +74,13 @@ class Interval:
         :param intervals: zero, one or more intervals.
         """
         self._intervals = []
+        self._hash = None
+
+        if len(intervals) == 1 and type(intervals[0]) is self.__class__:
+            # Atomic intervals of an instance of the same class are already sorted,
+            # disjoint and non-mergeable
+            self._intervals = list(intervals[0]._intervals)
+            return
 
         for interval in intervals:
             if isinstance(interval, Interval):
@@ -50,49 +90,7 @@ class Interval:
                 raise TypeError("Parameters must be Interval instances")
 
         if len(self._intervals) > 0:
-            # Sort intervals by lower bound, closed first.
-            self._intervals.sort(key=lambda i: (i.lower, i.left is Bound.OPEN))
-
-            i = 0
-            # Try to merge consecutive intervals
-            while i < len(self._intervals) - 1:
-                current = self._intervals[i]
-                successor = self._intervals[i + 1]
-
-                if self.__class__._mergeable(current, successor):
-                    if current.lower == successor.lower:
-                        lower = current.lower
-                        left = (
-                            current.left
-                            if current.left == Bound.CLOSED
-                            else successor.left
-                        )
-
-                    else:
-                        lower = min(current.lower, successor.lower)
-                        left = (
-                            current.left if lower == current.lower else successor.left
-                        )
-
-                    if current.upper == successor.upper:
-                        upper = current.upper
-                        right = (
-                            current.right
-                            if current.right == Bound.CLOSED
-                            else successor.right
-                        )
-                    else:
-                        upper = max(current.upper, successor.upper)
-                        right = (
-                            current.right if upper == current.upper else successor.right
-                        )
-
-                    union = Atomic(left, lower, upper, right)
-                    self._intervals.pop(i)  # pop current
-                    self._intervals.pop(i)  # pop successor
-                    self._intervals.insert(i, union)
-                else:
-                    i = i + 1
+            self._intervals = self.__class__._merge_atomics(self._intervals)
 
     @classmethod
     def from_atomic(cls, left, lower, upper, right):
@@ -112,9 +110,82 @@ class Interval:
         if lower < upper or (
             lower == upper and left == Bound.CLOSED and right == Bound.CLOSED
         ):
-            instance._intervals = [Atomic(left, lower, upper, right)]
+            instance._intervals = [_make_atomic(left, lower, upper, right)]
         return instance
 
+    @classmethod
+    def _fast_from_atomic(cls, atomic):
+        """
+        Create an Interval instance containing given atomic interval, without any
+        check nor conversion. This is only meant for internal use, when the atomic
+        interval is known to be non-empty and already normalized (e.g., when it
+        comes from an existing instance).
+
+        :param atomic: an atomic interval.
+        """
+        instance = cls()
+        instance._intervals = [atomic]
+        return instance
+
+    @classmethod
+    def _from_sorted_atomics(cls, atomics):
+        """
+        Create an Interval instance from given list of atomic intervals, without
+        any check nor conversion. This is only meant for internal use, when the
+        atomic intervals are known to be non-empty, normalized, sorted and not
+        mergeable. The list is used as-is and should not be modified afterwards.
+
+        :param atomics: a list of atomic intervals.
+        """
+        instance = cls()
+        instance._intervals = atomics
+        return instance
+
+    @classmethod
+    def _merge_atomics(cls, atomics):
+        """
+        Sort and merge given non-empty list of non-empty atomic intervals. The
+        list can be sorted in place.
+
+        :param atomics: a list of atomic intervals.
+        :return: a list of sorted and non-mergeable atomic intervals.
+        """
+        # Sort intervals by lower bound, closed first. Intervals are often
+        # provided in order (e.g., when they come from an existing interval),
+        # so check this first as it is cheaper than sorting them.
+        for a, b in zip(atomics, atomics[1:]):
+            if b.lower < a.lower or (
+                b.lower == a.lower and b.left is Bound.CLOSED and a.left is Bound.OPEN
+            ):
+                atomics.sort(key=_sort_key)
+                break
+
+        # Try to merge consecutive intervals, in a single pass
+        merged = []
+        append = merged.append
+        mergeable = cls._mergeable
+        current = atomics[0]
+
+        for successor in atomics[1:]:
+            if mergeable(current, successor):
+                # As intervals are sorted, current has the lowest lower bound
+                upper = current.upper
+                if upper == successor.upper:
+                    if current.right is Bound.OPEN:
+                        current = Atomic(
+                            current.left, current.lower, upper, successor.right
+                        )
+                elif upper < successor.upper:
+                    current = Atomic(
+                        current.left, current.lower, successor.upper, successor.right
+                    )
+            else:
+                append(current)
+                current = successor
+
+        append(current)
+        return merged
+
     @classmethod
     def _mergeable(cls, a, b):
         """
@@ -125,15 +196,31 @@ class Interval:
         :param b: an atomic interval.
         :return: True if mergeable, False otherwise.
         """
-        if a.lower < b.lower or (a.lower == b.lower and a.left == Bound.CLOSED):
-            first, second = a, b
+        a_lower, b_lower = a.lower, b.lower
+
+        # Compare the upper bound of the first interval with the lower bound of
+        # the second one, without swapping them first.
+        if a_lower < b_lower or (a_lower == b_lower and a.left is Bound.CLOSED):
+            upper = a.upper
+            if upper == b_lower:
+                return a.right is Bound.CLOSED or b.left is Bound.CLOSED
+            return upper > b_lower
         else:
-            first, second = b, a
+            upper = b.upper
+            if upper == a_lower:
+                return b.right is Bound.CLOSED or a.left is Bound.CLOSED
+            return upper > a_lower
 
-        if first.upper == second.lower:
-            return first.right == Bound.CLOSED or second.left == Bound.CLOSED
+    def _precedes(self, other):
+        """
+        Test whether current non-empty interval entirely precedes given
+        non-empty one, without being mergeable with it.
 
-        return first.upper > second.lower
+        :param other: an interval.
+        :return: True if current interval precedes given one.
+        """
+        last, first = self._intervals[-1], other._intervals[0]
+        return last.upper <= first.lower and not self.__class__._mergeable(last, first)
 
     @property
     def left(self):
@@ -176,7 +263,7 @@ class Interval:
         """
         True if interval is empty, False otherwise.
         """
-        return len(self._intervals) == 0
+        return not self._intervals
 
     @property
     def atomic(self):
@@ -194,7 +281,14 @@ class Interval:
 
         :return: an Interval instance.
         """
-        return self.__class__.from_atomic(self.left, self.lower, self.upper, self.right)
+        if self.atomic:
+            # Intervals are immutable, so self can be safely returned
+            return self
+
+        first, last = self._intervals[0], self._intervals[-1]
+        return self.__class__._fast_from_atomic(
+            _make_atomic(first.left, first.lower, last.upper, last.right)
+        )
 
     def replace(
         self, left=None, lower=None, upper=None, right=None, *, ignore_inf=True
@@ -218,33 +312,35 @@ class Interval:
             is True).
         :return: an Interval instance
         """
-        enclosure = self.enclosure
+        # The enclosure has the same bounds as the current interval
+        current_left, current_lower = self.left, self.lower
+        current_upper, current_right = self.upper, self.right
 
         if callable(left):
-            left = left(enclosure.left)
+            left = left(current_left)
         else:
-            left = enclosure.left if left is None else left
+            left = current_left if left is None else left
 
         if callable(lower):
-            if ignore_inf and enclosure.lower in [-inf, inf]:
-                lower = enclosure.lower
+            if ignore_inf and current_lower in (-inf, inf):
+                lower = current_lower
             else:
-                lower = lower(enclosure.lower)
+                lower = lower(current_lower)
         else:
-            lower = enclosure.lower if lower is None else lower
+            lower = current_lower if lower is None else lower
 
         if callable(upper):
-            if ignore_inf and enclosure.upper in [-inf, inf]:
-                upper = enclosure.upper
+            if ignore_inf and current_upper in (-inf, inf):
+                upper = current_upper
             else:
-                upper = upper(enclosure.upper)
+                upper = upper(current_upper)
         else:
-            upper = enclosure.upper if upper is None else upper
+            upper = current_upper if upper is None else upper
 
         if callable(right):
-            right = right(enclosure.right)
+            right = right(current_right)
         else:
-            right = enclosure.right if right is None else right
+            right = current_right if right is None else right
 
         if self.atomic:
             return self.__class__.from_atomic(left, lower, upper, right)
@@ -272,19 +368,23 @@ class Interval:
         :param func: function to apply on each underlying atomic interval.
         :return: an Interval instance.
         """
-        intervals = []
+        cls = self.__class__
+        atomics = []
 
         for i in self:
             value = func(i)
 
             if isinstance(value, Interval):
-                intervals.append(value)
+                atomics.extend(value._intervals)
             elif isinstance(value, tuple):
-                intervals.append(self.__class__.from_atomic(*value))
+                atomics.extend(cls.from_atomic(*value)._intervals)
             else:
                 raise TypeError(f"Unsupported return type {type(value)} for {value}")
 
-        return self.__class__(*intervals)
+        # Sort and merge all atomic intervals at once
+        if len(atomics) > 0:
+            atomics = cls._merge_atomics(atomics)
+        return cls._from_sorted_atomics(atomics)
 
     def adjacent(self, other):
         """
@@ -315,16 +415,23 @@ class Interval:
                 # Early out for clearly non-overlapping intervals
                 return False
 
-            i_iter = iter(self)
-            o_iter = iter(other)
-            i_current = next(i_iter, None)
-            o_current = next(o_iter, None)
+            i_atomics, o_atomics = self._intervals, other._intervals
+            n, m = len(i_atomics), len(o_atomics)
+            i = j = 0
 
-            while i_current is not None and o_current is not None:
-                if i_current < o_current:
-                    i_current = next(i_iter, None)
-                elif o_current < i_current:
-                    o_current = next(o_iter, None)
+            while i < n and j < m:
+                a, b = i_atomics[i], o_atomics[j]
+
+                if a.upper < b.lower or (
+                    a.upper == b.lower
+                    and (a.right is Bound.OPEN or b.left is Bound.OPEN)
+                ):
+                    i = i + 1
+                elif b.upper < a.lower or (
+                    b.upper == a.lower
+                    and (b.right is Bound.OPEN or a.left is Bound.OPEN)
+                ):
+                    j = j + 1
                 else:
                     return True
             return False
@@ -393,15 +500,18 @@ class Interval:
         return len(self._intervals)
 
     def __iter__(self):
-        yield from (self.__class__.from_atomic(*i) for i in self._intervals)
+        yield from (self.__class__._fast_from_atomic(i) for i in self._intervals)
 
     def __getitem__(self, item):
         if isinstance(item, slice):
-            return self.__class__(
-                *[self.__class__.from_atomic(*i) for i in self._intervals[item]]
-            )
+            # A subset of sorted, disjoint and non-mergeable atomic intervals
+            # remains so, up to its order.
+            atomics = self._intervals[item]
+            if item.step is not None and item.step < 0:
+                atomics.reverse()
+            return self.__class__._from_sorted_atomics(atomics)
         else:
-            return self.__class__.from_atomic(*self._intervals[item])
+            return self.__class__._fast_from_atomic(self._intervals[item])
 
     def __and__(self, other):
         if not isinstance(other, Interval):
@@ -425,37 +535,94 @@ class Interval:
                 upper = min(self.upper, other.upper)
                 right = self.right if upper == self.upper else other.right
 
-            return self.__class__.from_atomic(left, lower, upper, right)
+            if self.__class__ is not other.__class__:
+                return self.__class__.from_atomic(left, lower, upper, right)
+
+            # Both bounds are already normalized, only check for emptiness
+            if lower < upper or (
+                lower == upper and left == Bound.CLOSED and right == Bound.CLOSED
+            ):
+                return self.__class__._fast_from_atomic(
+                    _make_atomic(left, lower, upper, right)
+                )
+            return self.__class__()
         else:
-            intersections = []
-
-            i_iter = iter(self)
-            o_iter = iter(other)
-            i_current = next(i_iter, None)
-            o_current = next(o_iter, None)
-
-            while i_current is not None and o_current is not None:
-                if i_current < o_current:
-                    i_current = next(i_iter, None)
-                elif o_current < i_current:
-                    o_current = next(o_iter, None)
+            i_atomics, o_atomics = self._intervals, other._intervals
+            n, m = len(i_atomics), len(o_atomics)
+
+            # There are at most n + m - 1 intersections
+            intersections = [None] * (n + m)
+            i = j = k = 0
+
+            while i < n and j < m:
+                a, b = i_atomics[i], o_atomics[j]
+
+                if a.upper < b.lower or (
+                    a.upper == b.lower
+                    and (a.right is Bound.OPEN or b.left is Bound.OPEN)
+                ):
+                    i = i + 1
+                elif b.upper < a.lower or (
+                    b.upper == a.lower
+                    and (b.right is Bound.OPEN or a.left is Bound.OPEN)
+                ):
+                    j = j + 1
                 else:
-                    # i_current and o_current have an overlap
-                    intersections.append(i_current & o_current)
-
-                    if i_current <= o_current:
-                        # o_current can still intersect next i
-                        i_current = next(i_iter, None)
-                    elif o_current <= i_current:
-                        # i_current can still intersect next o
-                        o_current = next(o_iter, None)
+                    # a and b have an overlap
+                    if a.lower == b.lower:
+                        lower = a.lower
+                        left = a.left if a.left is Bound.OPEN else b.left
+                    elif a.lower > b.lower:
+                        lower, left = a.lower, a.left
+                    else:
+                        lower, left = b.lower, b.left
+
+                    if a.upper == b.upper:
+                        upper = a.upper
+                        right = a.right if a.right is Bound.OPEN else b.right
+                        a_first = a.right is Bound.OPEN or b.right is Bound.CLOSED
+                    elif a.upper < b.upper:
+                        upper, right, a_first = a.upper, a.right, True
                     else:
-                        raise AssertionError()
+                        upper, right, a_first = b.upper, b.right, False
 
-            return self.__class__(*intersections)
+                    intersections[k] = _make_atomic(left, lower, upper, right)
+                    k = k + 1
+
+                    if a_first:
+                        # b can still intersect next a
+                        i = i + 1
+                    else:
+                        # a can still intersect next b
+                        j = j + 1
+
+            del intersections[k:]
+
+            if self.__class__ is not other.__class__:
+                return self.__class__(
+                    *[self.__class__.from_atomic(*x) for x in intersections]
+                )
+
+            # Intersections are sorted, disjoint and not mergeable
+            return self.__class__._from_sorted_atomics(intersections)
 
     def __or__(self, other):
         if isinstance(other, Interval):
+            # Intervals are immutable, an operand can be returned as-is
+            if other.empty:
+                return self
+            elif self.empty and self.__class__ is other.__class__:
+                return other
+            elif self.__class__ is other.__class__ and not self.empty:
+                # Fast path if one operand entirely precedes the other one
+                if self._precedes(other):
+                    return self.__class__._from_sorted_atomics(
+                        self._intervals + other._intervals
+                    )
+                elif other._precedes(self):
+                    return self.__class__._from_sorted_atomics(
+                        other._intervals + self._intervals
+                    )
             return self.__class__(self, other)
         else:
             return NotImplemented
@@ -464,74 +631,173 @@ class Interval:
         if isinstance(item, Interval):
             if item.empty:
                 return True
-            elif self.upper < item.lower or self.lower > item.upper:
+            elif self.empty or self.upper < item.lower or self.lower > item.upper:
                 # Early out for non-overlapping intervals
                 return False
-            elif self.atomic:
-                left = item.lower > self.lower or (
-                    item.lower == self.lower
-                    and (item.left == self.left or self.left == Bound.CLOSED)
+
+            # Each atomic interval of item must be contained in the first atomic
+            # interval of self that does not entirely precede it.
+            atomics = self._intervals
+            n = len(atomics)
+            i = 0
+
+            for other in item._intervals:
+                current = atomics[i]
+                while current.upper < other.lower or (
+                    current.upper == other.lower
+                    and (current.right is Bound.OPEN or other.left is Bound.OPEN)
+                ):
+                    i += 1
+                    if i == n:
+                        return False
+                    current = atomics[i]
+
+                left = other.lower > current.lower or (
+                    other.lower == current.lower
+                    and (other.left is current.left or current.left is Bound.CLOSED)
                 )
-                right = item.upper < self.upper or (
-                    item.upper == self.upper
-                    and (item.right == self.right or self.right == Bound.CLOSED)
+                right = other.upper < current.upper or (
+                    other.upper == current.upper
+                    and (other.right is current.right or current.right is Bound.CLOSED)
                 )
-                return left and right
-            else:
-                selfiter = iter(self)
-                current = next(selfiter)
-
-                for other in item:
-                    while current < other:
-                        try:
-                            current = next(selfiter)
-                        except StopIteration:
-                            return False
-
-                    # here current and other could have an overlap
-                    if other not in current:
-                        return False
-                return True
+                if not (left and right):
+                    return False
+            return True
         else:
-            # Item is a value
-            if self.upper < item or self.lower > item:
+            # Item is a value. Atomic intervals are sorted and disjoint, so only
+            # the first one whose upper bound is not lower than item can
+            # contain it. Find it using a binary search.
+            intervals = self._intervals
+            lo, hi = 0, len(intervals)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if intervals[mid].upper < item:
+                    lo = mid + 1
+                else:
+                    hi = mid
+
+            if lo == len(intervals):
                 return False
 
-            for i in self._intervals:
-                left = (item >= i.lower) if i.left == Bound.CLOSED else (item > i.lower)
-                right = (
-                    (item <= i.upper) if i.right == Bound.CLOSED else (item < i.upper)
-                )
-                if left and right:
-                    return True
-            return False
+            i = intervals[lo]
+            left = (item >= i.lower) if i.left is Bound.CLOSED else (item > i.lower)
+            right = (item <= i.upper) if i.right is Bound.CLOSED else (item < i.upper)
+            return left and right
 
     def __invert__(self):
-        complements = [
-            self.__class__.from_atomic(Bound.OPEN, -inf, self.lower, ~self.left),
-            self.__class__.from_atomic(~self.right, self.upper, inf, Bound.OPEN),
-        ]
-
-        for i, j in zip(self._intervals[:-1], self._intervals[1:]):
-            complements.append(
-                self.__class__.from_atomic(~i.right, i.upper, j.lower, ~j.left)
+        cls = self.__class__
+        atomics = self._intervals
+
+        if not atomics:
+            return cls.from_atomic(Bound.OPEN, -inf, inf, Bound.OPEN)
+
+        # Complement is made of the gaps between consecutive atomic intervals,
+        # surrounded by the parts before the first one and after the last one.
+        # These are already sorted and not mergeable.
+        first, last = atomics[0], atomics[-1]
+        complements = []
+        complements.extend(
+            cls.from_atomic(Bound.OPEN, -inf, first.lower, ~first.left)._intervals
+        )
+
+        previous = first
+        for current in atomics[1:]:
+            complements.extend(
+                cls.from_atomic(
+                    ~previous.right, previous.upper, current.lower, ~current.left
+                )._intervals
             )
+            previous = current
+
+        complements.extend(
+            cls.from_atomic(~last.right, last.upper, inf, Bound.OPEN)._intervals
+        )
 
-        return self.__class__(*complements)
+        return cls._from_sorted_atomics(complements)
 
     def __sub__(self, other):
-        if isinstance(other, Interval):
-            return self & ~other
-        else:
+        if not isinstance(other, Interval):
             return NotImplemented
 
+        if self.__class__ is not other.__class__:
+            # Bounds of the complement of other depend on its class
+            return self & ~other
+
+        if self.upper < other.lower or self.lower > other.upper:
+            # Early out for non-overlapping intervals
+            return self
+
+        o_atomics = other._intervals
+        m = len(o_atomics)
+        j = 0
+        differences = []
+
+        for current in self._intervals:
+            left, lower, upper, right = current
+            clipped = False
+
+            # Skip the atomic intervals of other that are before current one
+            while j < m and (
+                o_atomics[j].upper < lower
+                or (
+                    o_atomics[j].upper == lower
+                    and (o_atomics[j].right is Bound.OPEN or left is Bound.OPEN)
+                )
+            ):
+                j = j + 1
+
+            while j < m:
+                o = o_atomics[j]
+
+                if o.lower > upper or (
+                    o.lower == upper and (o.left is Bound.OPEN or right is Bound.OPEN)
+                ):
+                    # o is after current one
+                    break
+
+                # Keep the part of current one that is before o, and carry on
+                # with the part that is after o. Bounds are converted by
+                # from_atomic, as they come from o and are reversed.
+                differences.extend(
+                    self.__class__.from_atomic(left, lower, o.lower, ~o.left)._intervals
+                )
+                left, lower = ~o.right, o.upper
+                clipped = True
+
+                if o.upper < upper:
+                    j = j + 1
+                else:
+                    # o can still overlap next atomic interval
+                    break
+
+            if clipped:
+                differences.extend(
+                    self.__class__.from_atomic(left, lower, upper, right)._intervals
+                )
+            else:
+                differences.append(current)
+
+        # Differences are sorted, disjoint and not mergeable
+        return self.__class__._from_sorted_atomics(differences)
+
     def __eq__(self, other):
         if isinstance(other, Interval):
+            if self is other:
+                return True
+
             if len(other._intervals) != len(self._intervals):
                 return False
 
+            if (
+                self._hash is not None
+                and other._hash is not None
+                and self._hash != other._hash
+            ):
+                # Equal intervals have equal hash values
+                return False
+
             for a, b in zip(self._intervals, other._intervals):
-                eq = (
+                eq = a is b or (
                     a.left == b.left
                     and a.lower == b.lower
                     and a.upper == b.upper
@@ -545,13 +811,14 @@ class Interval:
 
     def __lt__(self, other):
         if isinstance(other, Interval):
-            if self.empty or other.empty:
+            if not self._intervals or not other._intervals:
                 return False
 
-            if self.right == Bound.OPEN or other.left == Bound.OPEN:
-                return self.upper <= other.lower
+            a, b = self._intervals[-1], other._intervals[0]
+            if a.right is Bound.OPEN or b.left is Bound.OPEN:
+                return a.upper <= b.lower
             else:
-                return self.upper < other.lower
+                return a.upper < b.lower
         else:
             warnings.warn(
                 "Comparing an interval and a value is deprecated. "
@@ -564,13 +831,14 @@ class Interval:
 
     def __gt__(self, other):
         if isinstance(other, Interval):
-            if self.empty or other.empty:
+            if not self._intervals or not other._intervals:
                 return False
 
-            if self.left == Bound.OPEN or other.right == Bound.OPEN:
-                return self.lower >= other.upper
+            a, b = self._intervals[0], other._intervals[-1]
+            if a.left is Bound.OPEN or b.right is Bound.OPEN:
+                return a.lower >= b.upper
             else:
-                return self.lower > other.upper
+                return a.lower > b.upper
         else:
             warnings.warn(
                 "Comparing an interval and a value is deprecated. "
@@ -583,13 +851,14 @@ class Interval:
 
     def __le__(self, other):
         if isinstance(other, Interval):
-            if self.empty or other.empty:
+            if not self._intervals or not other._intervals:
                 return False
 
-            if self.right == Bound.OPEN or other.right == Bound.CLOSED:
-                return self.upper <= other.upper
+            a, b = self._intervals[-1], other._intervals[-1]
+            if a.right is Bound.OPEN or b.right is Bound.CLOSED:
+                return a.upper <= b.upper
             else:
-                return self.upper < other.upper
+                return a.upper < b.upper
         else:
             warnings.warn(
                 "Comparing an interval and a value is deprecated. "
@@ -600,13 +869,14 @@ class Interval:
 
     def __ge__(self, other):
         if isinstance(other, Interval):
-            if self.empty or other.empty:
+            if not self._intervals or not other._intervals:
                 return False
 
-            if self.left == Bound.OPEN or other.left == Bound.CLOSED:
-                return self.lower >= other.lower
+            a, b = self._intervals[0], other._intervals[0]
+            if a.left is Bound.OPEN or b.left is Bound.CLOSED:
+                return a.lower >= b.lower
             else:
-                return self.lower > other.lower
+                return a.lower > b.lower
         else:
             warnings.warn(
                 "Comparing an interval and a value is deprecated. "
@@ -616,7 +886,33 @@ class Interval:
             return not self.empty and self.lower >= other
 
     def __hash__(self):
-        return hash((self.lower, self.upper))
+        if self._hash is None:
+            # Not cached if it raises a TypeError (i.e., unhashable bounds)
+            if self._intervals:
+                bounds = (self._intervals[0].lower, self._intervals[-1].upper)
+            else:
+                bounds = (inf, -inf)
+            self._hash = hash(bounds)
+        return self._hash
+
+    def __getstate__(self):
+        # Same state as the default one, except for the cached hash, since hash
+        # values can differ between processes. This is also the state of
+        # instances pickled before hashes were cached.
+        slots = {
+            name: getattr(self, name)
+            for name in copyreg._slotnames(type(self))
+            if name != "_hash" and hasattr(self, name)
+        }
+        return getattr(self, "__dict__", None) or None, slots
+
+    def __setstate__(self, state):
+        attributes, slots = state
+        if attributes:
+            self.__dict__.update(attributes)
+        for name, value in (slots or {}).items():
+            setattr(self, name, value)
+        self._hash = None
 
     def __repr__(self):
         if self.empty:
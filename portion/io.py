@@ -1,8 +1,63 @@
+import functools
 import re
 
 from .const import Bound, inf
 from .interval import Interval
 
+# Both infinities are singletons, so bounds can be compared by identity. Default
+# encodings of infinities are shared by to_data and from_data, so that exported
+# infinities are also recognised by identity when imported back.
+_NINF = -inf
+_FLOAT_PINF = float("inf")
+_FLOAT_NINF = float("-inf")
+
+# Bound types for values accepted by Bound, which is slow to call
+_BOUNDS = {
+    True: Bound.CLOSED,
+    False: Bound.OPEN,
+    Bound.CLOSED: Bound.CLOSED,
+    Bound.OPEN: Bound.OPEN,
+}
+
+# Regex constructs whose outcome depends on what precedes the matching position,
+# i.e., anchors, word boundaries and lookbehinds
+_CONTEXT_TOKENS = ("^", r"\A", r"\b", r"\B", "(?<")
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_patterns(
+    bound, disj, sep, left_open, left_closed, right_open, right_closed, pinf, ninf
+):
+    """
+    Compile the regular expressions used by from_string for given parameters,
+    which are the regex patterns accepted by from_string. Results are cached, as
+    the same parameters are usually used for many calls.
+
+    :return: a 7-uple made of six compiled patterns (for an atomic interval, the
+        disjunctive operator, a left closed boundary, a right closed boundary,
+        a positive infinity and a negative infinity), and a boolean that is True
+        if the first two patterns depend on what precedes the position they are
+        matched at.
+    """
+    re_left_boundary = rf"(?P<left>{left_open}|{left_closed})"
+    re_right_boundary = rf"(?P<right>{right_open}|{right_closed})"
+    re_bounds = rf"(?P<lower>{bound})({sep}(?P<upper>{bound}))?"
+    re_interval = rf"{re_left_boundary}(|{re_bounds}){re_right_boundary}"
+
+    return (
+        re.compile(re_interval),
+        re.compile(disj),
+        re.compile(left_closed + "$"),
+        re.compile(right_closed + "$"),
+        re.compile(pinf),
+        re.compile(ninf),
+        any(
+            token in pattern
+            for pattern in (re_interval, disj)
+            for token in _CONTEXT_TOKENS
+        ),
+    )
+
 
 def from_string(
     string,
@@ -41,58 +96,88 @@ def from_string(
     :return: an interval.
     """
 
-    re_left_boundary = rf"(?P<left>{left_open}|{left_closed})"
-    re_right_boundary = rf"(?P<right>{right_open}|{right_closed})"
-    re_bounds = rf"(?P<lower>{bound})({sep}(?P<upper>{bound}))?"
-    re_interval = rf"{re_left_boundary}(|{re_bounds}){re_right_boundary}"
+    (
+        re_interval,
+        re_disj,
+        re_left_closed,
+        re_right_closed,
+        re_pinf,
+        re_ninf,
+        sliced,
+    ) = _compile_patterns(
+        bound, disj, sep, left_open, left_closed, right_open, right_closed, pinf, ninf
+    )
 
     intervals = []
     has_more = True
-    source = string
+    # Position of the next atomic interval, to avoid slicing the string
+    pos = 0
+
+    def _match(pattern, pos):
+        # Patterns that depend on what precedes the current position (e.g.,
+        # anchors or lookbehinds) are matched on the remaining string instead
+        if sliced:
+            match = pattern.match(string[pos:])
+            return match, None if match is None else pos + match.end()
+        match = pattern.match(string, pos)
+        return match, None if match is None else match.end()
 
     def _convert(bound):
-        if re.match(pinf, bound):
+        if re_pinf.match(bound):
             return inf
-        elif re.match(ninf, bound):
+        elif re_ninf.match(bound):
             return -inf
         else:
             return conv(bound)
 
     while has_more:
-        match = re.match(re_interval, string)
+        match, pos = _match(re_interval, pos)
         if match is None:
-            raise ValueError(f'"{source}" cannot be parsed to an interval.')
+            raise ValueError(f'"{string}" cannot be parsed to an interval.')
 
         # Parse atomic interval
         group = match.groupdict()
 
-        left = (
-            Bound.CLOSED if re.match(left_closed + "$", group["left"]) else Bound.OPEN
-        )
-        right = (
-            Bound.CLOSED if re.match(right_closed + "$", group["right"]) else Bound.OPEN
-        )
+        left = Bound.CLOSED if re_left_closed.match(group["left"]) else Bound.OPEN
+        right = Bound.CLOSED if re_right_closed.match(group["right"]) else Bound.OPEN
         lower = group.get("lower", None)
         upper = group.get("upper", None)
         lower = _convert(lower) if lower is not None else inf
         upper = _convert(upper) if upper is not None else lower
 
         intervals.append(klass.from_atomic(left, lower, upper, right))
-        string = string[match.end() :]
 
         # Are there more atomic intervals?
-        if len(string) > 0:
-            match = re.match(disj, string)
+        if pos < len(string):
+            match, pos = _match(re_disj, pos)
             if match is None:
-                raise ValueError(f'"{source}" cannot be parsed to an interval.')
-            else:
-                string = string[match.end() :]
+                raise ValueError(f'"{string}" cannot be parsed to an interval.')
         else:
             has_more = False
 
     return klass(*intervals)
 
 
+# Patterns for default parameters are compiled at import time, and passed in the
+# same order as in from_string so that its first call hits the cache
+_compile_patterns(
+    *(
+        from_string.__kwdefaults__[name]
+        for name in (
+            "bound",
+            "disj",
+            "sep",
+            "left_open",
+            "left_closed",
+            "right_open",
+            "right_closed",
+            "pinf",
+            "ninf",
+        )
+    )
+)
+
+
 def to_string(
     interval,
     conv=repr,
@@ -125,32 +210,30 @@ def to_string(
         return left_open + right_open
 
     def _convert(bound):
-        if bound == inf:
+        if bound is inf:
             return pinf
-        elif bound == -inf:
+        elif bound is _NINF:
             return ninf
         else:
             return conv(bound)
 
     exported_intervals = []
-    for item in interval:
-        left = left_open if item.left == Bound.OPEN else left_closed
-        right = right_open if item.right == Bound.OPEN else right_closed
+    append = exported_intervals.append
 
-        lower = _convert(item.lower)
-        upper = _convert(item.upper)
+    # Atomic intervals are read directly, rather than wrapped in Interval instances
+    for left, lower, upper, right in interval._intervals:
+        left = left_open if left is Bound.OPEN else left_closed
+        right = right_open if right is Bound.OPEN else right_closed
 
-        if item.lower == item.upper:
-            exported_intervals.append(left + lower + right)
+        if lower == upper:
+            append(left + _convert(lower) + right)
         else:
-            exported_intervals.append(left + lower + sep + upper + right)
+            append(left + _convert(lower) + sep + _convert(upper) + right)
 
     return disj.join(exported_intervals)
 
 
-def from_data(
-    data, conv=None, *, pinf=float("inf"), ninf=float("-inf"), klass=Interval
-):
+def from_data(data, conv=None, *, pinf=_FLOAT_PINF, ninf=_FLOAT_NINF, klass=Interval):
     """
     Import an interval from a list of 4-uples (left, lower, upper, right).
 
@@ -161,31 +244,32 @@ def from_data(
     :param klass: class to use for creating intervals (default to Interval).
     :return: an interval.
     """
-    intervals = []
     conv = (lambda v: v) if conv is None else conv
+    from_atomic = klass.from_atomic
 
     def _convert(bound):
-        if bound == pinf:
+        if bound is pinf or bound == pinf:
             return inf
-        elif bound == ninf:
-            return -inf
+        elif bound is ninf or bound == ninf:
+            return _NINF
         else:
             return conv(bound)
 
-    for item in data:
-        left, lower, upper, right = item
-        intervals.append(
-            klass.from_atomic(
-                Bound(left),
-                _convert(lower),
-                _convert(upper),
-                Bound(right),
-            )
-        )
+    def _bound(value):
+        try:
+            return _BOUNDS[value]
+        except (KeyError, TypeError):
+            # Let Bound handle (or reject) any other value
+            return Bound(value)
+
+    intervals = [
+        from_atomic(_bound(left), _convert(lower), _convert(upper), _bound(right))
+        for left, lower, upper, right in data
+    ]
     return klass(*intervals)
 
 
-def to_data(interval, conv=None, *, pinf=float("inf"), ninf=float("-inf")):
+def to_data(interval, conv=None, *, pinf=_FLOAT_PINF, ninf=_FLOAT_NINF):
     """
     Export given interval to a list of 4-uples (left, lower, upper, right).
 
@@ -197,23 +281,16 @@ def to_data(interval, conv=None, *, pinf=float("inf"), ninf=float("-inf")):
     """
     conv = (lambda v: v) if conv is None else conv
 
-    data = []
-
     def _convert(bound):
-        if bound == inf:
+        if bound is inf:
             return pinf
-        elif bound == -inf:
+        elif bound is _NINF:
             return ninf
         else:
             return conv(bound)
 
-    for item in interval:
-        data.append(
-            (
-                item.left.value,
-                _convert(item.lower),
-                _convert(item.upper),
-                item.right.value,
-            )
-        )
-    return data
+    # Atomic intervals are read directly, rather than wrapped in Interval instances
+    return [
+        (left.value, _convert(lower), _convert(upper), right.value)
+        for left, lower, upper, right in interval._intervals
+    ]
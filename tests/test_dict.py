@@ -217,6 +217,20 @@ class TestIntervalDict:
             (P.openclosed(3, 4), 2)
         ])
 
+    def test_combine_many_keys(self):
+        def how(x, y, z): return x, y, z
+
+        d1 = P.IntervalDict([(P.closed(2 * k, 2 * k + 1), k) for k in range(100)])
+        d2 = P.IntervalDict([(P.closed(2 * k + 1, 2 * k + 2), -k - 1) for k in range(100)])
+        combined = d1.combine(d2, how, pass_interval=True)
+
+        assert len(combined) == 100 + 100 + 199
+        for k in range(1, 100):
+            assert combined[2 * k] == (k, -k, P.singleton(2 * k))
+            assert combined[2 * k + 1] == (k, -k - 1, P.singleton(2 * k + 1))
+        assert combined[0.5] == 0
+        assert combined[200] == -100
+
     def test_containment(self):
         d = P.IntervalDict([(P.closed(0, 3), 0)])
         assert 0 in d
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 import portion as P
@@ -56,6 +58,37 @@ class TestIntInterval:
         assert D.openclosed(0, 2) | D.closedopen(3, 5) == D.open(0, 5) == D.closed(1, 4)
         assert not (D.closedopen(0, 1) | D.openclosed(1, 2)).atomic
 
+    def test_creation_from_other_class(self):
+        # Atomic intervals are merged again when classes differ
+        i = P.closed(0, 1) | P.closed(2, 3)
+        assert type(IntInterval(i)) is IntInterval
+        assert IntInterval(i) == D.closed(0, 3)
+        assert IntInterval(D.closed(0, 1) | D.closed(3, 4)) == D.closed(0, 1) | D.closed(3, 4)
+
+    def test_not_shared(self):
+        # Instances of subclasses can hold other attributes
+        assert type(D.empty()) is IntInterval
+        assert D.empty() is not D.empty()
+        assert D.singleton(1) is not D.singleton(1)
+        assert D.closed(0, 2) is not D.closed(0, 2)
+
+        i = D.closed(0, 2)
+        i.note = 'mine'
+        assert not hasattr(D.closed(0, 2), 'note')
+
+    def test_pickle(self):
+        i = D.closed(0, 1) | D.closed(3, 4)
+        j = pickle.loads(pickle.dumps(i))
+        assert type(j) is IntInterval
+        assert j == i
+        assert j | D.singleton(2) == D.closed(0, 4)
+
+    def test_difference_with_other_class(self):
+        # Complement is computed with the class of the subtracted interval
+        assert P.openclosed(-P.inf, 5) - D.closed(5, 6) == P.openclosed(-P.inf, 4)
+        assert P.open(0, 5.5) - D.closed(6, 7) == P.openclosed(0, 5)
+        assert D.closed(0, 10) - P.open(2, 3) == D.closed(0, 10)
+
     def test_adjacent(self):
         assert D.singleton(1).adjacent(D.singleton(2))
         assert not D.singleton(1).adjacent(D.singleton(3))
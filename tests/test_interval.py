@@ -1,7 +1,37 @@
+import copy
+import operator
+import pickle
+
 import pytest
 
 import portion as P
 
+# Intervals shared by several tests. Intervals are immutable, so they can be
+# safely reused as operands. Expected results are still spelled out.
+C01 = P.closed(0, 1)
+C02 = P.closed(0, 2)
+C11 = P.closed(1, 1)
+C12 = P.closed(1, 2)
+O01 = P.open(0, 1)
+O02 = P.open(0, 2)
+O12 = P.open(1, 2)
+O23 = P.open(2, 3)
+OC02 = P.openclosed(0, 2)
+OC12 = P.openclosed(1, 2)
+CO02 = P.closedopen(0, 2)
+S0 = P.singleton(0)
+S2 = P.singleton(2)
+C02_46 = C02 | P.closed(4, 6)
+C02_46_810 = C02_46 | P.closed(8, 10)
+
+# Parametrization tables
+CMP_TRIPLES = (
+    (C01, C12, P.closed(2, 3)),
+    (O02, P.open(1, 3), P.open(2, 4)),
+)
+IDENTITY_INTERVALS = (C01, O01, P.openclosed(0, 1), P.closedopen(0, 1))
+IDENTITY_IDS = ('closed', 'open', 'openclosed', 'closedopen')
+
 
 class TestHelpers:
     def test_bounds(self):
@@ -28,6 +58,29 @@ class TestHelpers:
         assert P.singleton(P.inf) == P.empty()
         assert P.singleton(-P.inf) == P.empty()
 
+    def test_shared_empty(self):
+        assert P.empty() is P.empty()
+
+    def test_interned_bounds(self):
+        assert P.closed(0, 1)._intervals[0] is P.closed(0, 1)._intervals[0]
+
+        # Equal but distinguishable values should not be shared
+        assert P.closed(1, 2) == P.closed(1.0, 2.0)
+        assert type(P.closed(1.0, 2.0).lower) is float
+        assert type(P.closed(True, 2).lower) is bool
+
+    def test_shared_singletons(self):
+        assert P.singleton(2) is P.singleton(2)
+        assert P.singleton(P.inf) is P.singleton(P.inf)
+        assert type(P.singleton(2.0).lower) is float
+        assert type(P.singleton(True).lower) is bool
+
+    def test_shared_intervals(self):
+        assert P.closed(0, 2) is P.closed(0, 2)
+        assert P.open(-P.inf, 2) is P.open(-P.inf, 2)
+        assert P.openclosed(0, 2) is not P.closedopen(0, 2)
+        assert type(P.closed(0, 2.0).upper) is float
+
 
 class TestRepr:
     def test_simple(self):
@@ -51,6 +104,11 @@ class TestRepr:
         assert repr(P.singleton(1) | P.singleton(2)) == '[1] | [2]'
 
 
+class TaggedInterval(P.Interval):
+    # Module-level, so that instances can be pickled
+    __slots__ = ('tag',)
+
+
 class TestInterval:
     def test_creation(self):
         assert P.Interval() == P.empty()
@@ -66,6 +124,12 @@ class TestInterval:
         # https://github.com/AlexandreDecan/python-intervals/issues/19
         assert P.Interval(P.empty(), P.empty()) == P.empty()
 
+    def test_creation_from_single_interval(self):
+        i = P.closed(0, 1) | P.closed(2, 3)
+        assert P.Interval(i) == i
+        assert P.Interval(i) is not i
+        assert P.Interval(P.empty()) == P.empty()
+
     def test_bounds(self):
         i = P.openclosed(1, 2)
         assert i.left == P.OPEN
@@ -135,14 +199,66 @@ class TestInterval:
         with pytest.raises(TypeError):
             hash(P.closed(-1, 0) | x)
 
+        # Failures are not cached
+        with pytest.raises(TypeError):
+            hash(x)
+
         # Not guaranteed to work
         assert hash(P.closed(-1, 0) | x | P.closed(3, 4)) is not None
 
+    def test_hash_is_stable(self):
+        i = P.closed(0, 1) | P.closed(3, 4)
+        assert hash(i) == hash(i)
+        assert hash(i) == hash(P.closed(0, 1) | P.closed(3, 4))
+        assert len({i, P.closed(0, 1) | P.closed(3, 4), P.closed(3, 4) | P.closed(0, 1)}) == 1
+
+    def test_pickle(self):
+        i = P.closed(0, 1) | P.closed(3, 4)
+        hash(i)
+        j = pickle.loads(pickle.dumps(i))
+        assert j == i
+        assert hash(j) == hash(i)
+        assert pickle.loads(pickle.dumps(P.empty())) == P.empty()
+
+    def test_pickled_state(self):
+        # Instances pickled before hashes were cached only have _intervals
+        i = P.closed(0, 1) | P.closed(3, 4)
+        state = i.__reduce_ex__(2)[2]
+        assert state == (None, {'_intervals': i._intervals})
+
+        j = P.Interval.__new__(P.Interval)
+        j.__setstate__(state)
+        assert j == i
+        assert hash(j) == hash(i)
+
+    def test_pickle_and_copy_subclass_slots(self):
+        i = TaggedInterval(P.closed(0, 1) | P.closed(3, 4))
+        i.tag = 'x'
+        hash(i)
+
+        for j in [pickle.loads(pickle.dumps(i)), copy.copy(i), copy.deepcopy(i)]:
+            assert type(j) is TaggedInterval
+            assert j == i
+            assert j.tag == 'x'
+            assert j._hash is None
+
     def test_enclosure(self):
         assert P.closed(0, 1) == P.closed(0, 1).enclosure
         assert P.open(0, 1) == P.open(0, 1).enclosure
         assert P.closed(0, 4) == (P.closed(0, 1) | P.closed(3, 4)).enclosure
         assert P.openclosed(0, 4) == (P.open(0, 1) | P.closed(3, 4)).enclosure
+        assert P.empty() == P.empty().enclosure
+
+        i = P.closed(0, 1)
+        assert i.enclosure is i
+
+    def test_slots(self):
+        i = P.closed(0, 1) | P.closed(2, 3)
+        assert not hasattr(i, '__dict__')
+        assert not hasattr(i._intervals[0], '__dict__')
+
+        with pytest.raises(AttributeError):
+            i.foo = 1
 
 
 class TestIntervalReplace:
@@ -197,6 +313,12 @@ class TestIntervalApply:
 
         assert i.apply(lambda s: (s.left, s.lower, s.upper * 2, s.right)) == P.closed(0, 6)
 
+    def test_apply_on_many_atomics(self):
+        i = P.Interval(*[P.closed(x, x + 1) for x in range(0, 3000, 3)])
+        assert i.apply(lambda s: (s.left, -s.upper, -s.lower, s.right)) == P.Interval(*[P.closed(-x - 1, -x) for x in range(0, 3000, 3)])
+        assert i.apply(lambda s: (s.left, s.lower, s.upper + 2, s.right)) == P.closed(0, 3000)
+        assert i.apply(lambda s: P.empty() if s.lower % 2 else s) == P.Interval(*[P.closed(x, x + 1) for x in range(0, 3000, 6)])
+
     def test_apply_on_empty(self):
         assert P.empty().apply(lambda s: (P.CLOSED, 1, 2, P.CLOSED)) == P.empty()
 
@@ -210,109 +332,143 @@ class TestIntervalApply:
 
 
 class TestIntervalAdjacent():
-    def test_adjacent(self):
-        assert P.closedopen(0, 1).adjacent(P.closedopen(1, 2))
-        assert P.closed(0, 1).adjacent(P.open(1, 2))
-        assert not P.closed(0, 1).adjacent(P.closed(1, 2))
-        assert not P.open(0, 1).adjacent(P.open(1, 2))
-
-    def test_reversed_adjacent(self):
-        assert P.closedopen(1, 2).adjacent(P.closedopen(0, 1))
-        assert P.open(1, 2).adjacent(P.closed(0, 1))
-        assert not P.closed(1, 2).adjacent(P.closed(0, 1))
-        assert not P.open(1, 2).adjacent(P.open(0, 1))
-
-    def test_non_adjacent(self):
-        assert not P.closedopen(0, 1).adjacent(P.closedopen(3, 4))
-        assert not P.closed(0, 1).adjacent(P.open(3, 4))
-        assert not P.closed(0, 1).adjacent(P.closed(3, 4))
-        assert not P.open(0, 1).adjacent(P.open(3, 4))
-
-        assert not P.closedopen(3, 4).adjacent(P.closedopen(0, 1))
-        assert not P.open(3, 4).adjacent(P.closed(0, 1))
-        assert not P.closed(3, 4).adjacent(P.closed(0, 1))
-        assert not P.open(3, 4).adjacent(P.open(0, 1))
-
-    def test_overlapping(self):
-        assert not P.openclosed(0, 2).adjacent(P.closedopen(2, 3))
-        assert not P.closed(0, 2).adjacent(P.closedopen(2, 3))
-        assert not P.closed(0, 2).adjacent(P.closed(2, 3))
-        assert not P.open(0, 2).adjacent(P.open(2, 3))
-
-        assert not P.closedopen(2, 3).adjacent(P.openclosed(0, 2))
-        assert not P.closedopen(2, 3).adjacent(P.closed(0, 2))
-        assert not P.closed(2, 3).adjacent(P.closed(0, 2))
-        assert not P.open(2, 3).adjacent(P.open(0, 2))
-
-    def test_contained(self):
-        assert not P.closed(0, 4).adjacent(P.closed(0, 2))
-        assert not P.closed(0, 4).adjacent(P.closed(2, 4))
-        assert not P.closed(0, 4).adjacent(P.open(0, 2))
-        assert not P.closed(0, 4).adjacent(P.open(2, 4))
-
-        assert not P.closed(0, 2).adjacent(P.closed(0, 4))
-        assert not P.closed(2, 4).adjacent(P.closed(0, 4))
-        assert not P.closed(0, 2).adjacent(P.open(0, 4))
-        assert not P.closed(2, 4).adjacent(P.open(0, 4))
-
-        assert not P.closed(0, 2).adjacent(P.closed(0, 2))
-        assert not P.open(0, 2).adjacent(P.open(0, 2))
-        assert not P.openclosed(0, 2).adjacent(P.openclosed(0, 2))
-        assert not P.closedopen(0, 2).adjacent(P.closedopen(0, 2))
-
-    def test_same_bounds(self):
-        assert not P.closed(0, 2).adjacent(P.open(0, 2))
-        assert not P.open(0, 2).adjacent(P.closed(0, 2))
-        assert not P.openclosed(0, 2).adjacent(P.closedopen(0, 2))
-        assert not P.closedopen(0, 2).adjacent(P.openclosed(0, 2))
-
-    def test_empty(self):
-        assert P.empty().adjacent(P.closed(0, 2))
-        assert P.empty().adjacent(P.empty())
-        assert P.closed(0, 2).adjacent(P.empty())
+    @pytest.mark.parametrize('i1,i2,expected', [
+        (P.closedopen(0, 1), P.closedopen(1, 2), True),
+        (P.closed(0, 1), P.open(1, 2), True),
+        (P.closed(0, 1), P.closed(1, 2), False),
+        (P.open(0, 1), P.open(1, 2), False),
+    ])
+    def test_adjacent(self, i1, i2, expected):
+        assert i1.adjacent(i2) is expected
+
+    @pytest.mark.parametrize('i1,i2,expected', [
+        (P.closedopen(1, 2), P.closedopen(0, 1), True),
+        (P.open(1, 2), P.closed(0, 1), True),
+        (P.closed(1, 2), P.closed(0, 1), False),
+        (P.open(1, 2), P.open(0, 1), False),
+    ])
+    def test_reversed_adjacent(self, i1, i2, expected):
+        assert i1.adjacent(i2) is expected
+
+    @pytest.mark.parametrize('i1,i2', [
+        (P.closedopen(0, 1), P.closedopen(3, 4)),
+        (P.closed(0, 1), P.open(3, 4)),
+        (P.closed(0, 1), P.closed(3, 4)),
+        (P.open(0, 1), P.open(3, 4)),
+        (P.closedopen(3, 4), P.closedopen(0, 1)),
+        (P.open(3, 4), P.closed(0, 1)),
+        (P.closed(3, 4), P.closed(0, 1)),
+        (P.open(3, 4), P.open(0, 1)),
+    ])
+    def test_non_adjacent(self, i1, i2):
+        assert not i1.adjacent(i2)
+
+    @pytest.mark.parametrize('i1,i2', [
+        (P.openclosed(0, 2), P.closedopen(2, 3)),
+        (P.closed(0, 2), P.closedopen(2, 3)),
+        (P.closed(0, 2), P.closed(2, 3)),
+        (P.open(0, 2), P.open(2, 3)),
+        (P.closedopen(2, 3), P.openclosed(0, 2)),
+        (P.closedopen(2, 3), P.closed(0, 2)),
+        (P.closed(2, 3), P.closed(0, 2)),
+        (P.open(2, 3), P.open(0, 2)),
+    ])
+    def test_overlapping(self, i1, i2):
+        assert not i1.adjacent(i2)
+
+    @pytest.mark.parametrize('i1,i2', [
+        (P.closed(0, 4), P.closed(0, 2)),
+        (P.closed(0, 4), P.closed(2, 4)),
+        (P.closed(0, 4), P.open(0, 2)),
+        (P.closed(0, 4), P.open(2, 4)),
+        (P.closed(0, 2), P.closed(0, 4)),
+        (P.closed(2, 4), P.closed(0, 4)),
+        (P.closed(0, 2), P.open(0, 4)),
+        (P.closed(2, 4), P.open(0, 4)),
+        (P.closed(0, 2), P.closed(0, 2)),
+        (P.open(0, 2), P.open(0, 2)),
+        (P.openclosed(0, 2), P.openclosed(0, 2)),
+        (P.closedopen(0, 2), P.closedopen(0, 2)),
+    ])
+    def test_contained(self, i1, i2):
+        assert not i1.adjacent(i2)
+
+    @pytest.mark.parametrize('i1,i2', [
+        (P.closed(0, 2), P.open(0, 2)),
+        (P.open(0, 2), P.closed(0, 2)),
+        (P.openclosed(0, 2), P.closedopen(0, 2)),
+        (P.closedopen(0, 2), P.openclosed(0, 2)),
+    ])
+    def test_same_bounds(self, i1, i2):
+        assert not i1.adjacent(i2)
+
+    @pytest.mark.parametrize('i1,i2,expected', [
+        (P.empty(), P.closed(0, 2), True),
+        (P.empty(), P.empty(), True),
+        (P.closed(0, 2), P.empty(), True),
+        (P.empty(), P.closed(0, 1) | P.closed(2, 3), False),
+        (P.closed(0, 1) | P.closed(2, 3), P.empty(), False),
+    ])
+    def test_empty(self, i1, i2, expected):
+        assert i1.adjacent(i2) is expected
+
+    @pytest.mark.parametrize('i1,i2,expected', [
+        (P.closed(0, 1) | P.closed(2, 3), P.open(1, 2), True),
+        (P.open(1, 2), P.closed(0, 1) | P.closed(2, 3), True),
+        (P.closed(0, 1) | P.closed(2, 3), P.closed(1, 2), False),
+        (P.closedopen(0, 1) | P.openclosed(2, 3), P.open(-1, 0) | P.closed(1, 2) | P.openclosed(3, 4), True),
+    ])
+    def test_nonatomic_interval(self, i1, i2, expected):
+        assert i1.adjacent(i2) is expected
 
-        assert not P.empty().adjacent(P.closed(0, 1) | P.closed(2, 3))
-        assert not (P.closed(0, 1) | P.closed(2, 3)).adjacent(P.empty())
 
-    def test_nonatomic_interval(self):
-        assert (P.closed(0, 1) | P.closed(2, 3)).adjacent(P.open(1, 2))
-        assert P.open(1, 2).adjacent(P.closed(0, 1) | P.closed(2, 3))
-        assert not (P.closed(0, 1) | P.closed(2, 3)).adjacent(P.closed(1, 2))
-        assert (P.closedopen(0, 1) | P.openclosed(2, 3)).adjacent(P.open(-1, 0) | P.closed(1, 2) | P.openclosed(3, 4))
+class TestIntervalOverlaps():
+    @pytest.mark.parametrize('i1,i2', [
+        (P.closed(1, 2), P.closed(2, 3)),
+        (P.closed(1, 2), P.closedopen(2, 3)),
+        (P.openclosed(1, 2), P.closed(2, 3)),
+        (P.openclosed(1, 2), P.closedopen(2, 3)),
+    ])
+    def test_overlaps(self, i1, i2):
+        assert i1.overlaps(i2)
 
+    @pytest.mark.parametrize('i1,i2', [
+        (P.closed(0, 1), P.closed(3, 4)),
+        (P.closed(3, 4), P.closed(0, 1)),
+    ])
+    def test_overlaps_with_nonoverlaping(self, i1, i2):
+        assert not i1.overlaps(i2)
+
+    @pytest.mark.parametrize('i1,i2,expected', [
+        (P.closed(0, 1), P.open(1, 2), False),
+        (P.closed(0, 1), P.openclosed(1, 2), False),
+        (P.closedopen(0, 1), P.closed(1, 2), False),
+        (P.closedopen(0, 1), P.closedopen(1, 2), False),
+        (P.closedopen(0, 1), P.openclosed(1, 2), False),
+        (P.closedopen(0, 1), P.open(1, 2), False),
+        (P.open(0, 1), P.open(1, 2), False),
+        (P.open(0, 2), P.open(0, 1), True),
+        (P.open(0, 1), P.open(0, 2), True),
+    ])
+    def test_overlaps_with_edge_cases(self, i1, i2, expected):
+        assert i1.overlaps(i2) is expected
 
-class TestIntervalOverlaps():
-    def test_overlaps(self):
-        assert P.closed(1, 2).overlaps(P.closed(2, 3))
-        assert P.closed(1, 2).overlaps(P.closedopen(2, 3))
-        assert P.openclosed(1, 2).overlaps(P.closed(2, 3))
-        assert P.openclosed(1, 2).overlaps(P.closedopen(2, 3))
-
-    def test_overlaps_with_nonoverlaping(self):
-        assert not P.closed(0, 1).overlaps(P.closed(3, 4))
-        assert not P.closed(3, 4).overlaps(P.closed(0, 1))
-
-    def test_overlaps_with_edge_cases(self):
-        assert not P.closed(0, 1).overlaps(P.open(1, 2))
-        assert not P.closed(0, 1).overlaps(P.openclosed(1, 2))
-        assert not P.closedopen(0, 1).overlaps(P.closed(1, 2))
-        assert not P.closedopen(0, 1).overlaps(P.closedopen(1, 2))
-        assert not P.closedopen(0, 1).overlaps(P.openclosed(1, 2))
-        assert not P.closedopen(0, 1).overlaps(P.open(1, 2))
-        assert not P.open(0, 1).overlaps(P.open(1, 2))
-        assert P.open(0, 2).overlaps(P.open(0, 1))
-        assert P.open(0, 1).overlaps(P.open(0, 2))
-
-    def test_overlaps_with_empty(self):
-        assert not P.empty().overlaps(P.open(-P.inf, P.inf))
-        assert not P.open(-P.inf, P.inf).overlaps(P.empty())
-
-    def test_overlaps_with_itself(self):
-        assert P.closed(0, 1).overlaps(P.closed(0, 1))
-        assert P.closed(0, 1).overlaps(P.open(0, 1))
-        assert P.open(0, 1).overlaps(P.closed(0, 1))
-        assert P.closed(0, 1).overlaps(P.openclosed(0, 1))
-        assert P.closed(0, 1).overlaps(P.closedopen(0, 1))
+    @pytest.mark.parametrize('i1,i2', [
+        (P.empty(), P.open(-P.inf, P.inf)),
+        (P.open(-P.inf, P.inf), P.empty()),
+    ])
+    def test_overlaps_with_empty(self, i1, i2):
+        assert not i1.overlaps(i2)
+
+    @pytest.mark.parametrize('i1,i2', [
+        (P.closed(0, 1), P.closed(0, 1)),
+        (P.closed(0, 1), P.open(0, 1)),
+        (P.open(0, 1), P.closed(0, 1)),
+        (P.closed(0, 1), P.openclosed(0, 1)),
+        (P.closed(0, 1), P.closedopen(0, 1)),
+    ])
+    def test_overlaps_with_itself(self, i1, i2):
+        assert i1.overlaps(i2)
 
     def test_overlaps_with_incompatible_types(self):
         with pytest.raises(TypeError):
@@ -320,10 +476,7 @@ class TestIntervalOverlaps():
 
 
 class TestIntervalComparison:
-    @pytest.mark.parametrize('i1,i2,i3', [
-        (P.closed(0, 1), P.closed(1, 2), P.closed(2, 3)),
-        (P.open(0, 2), P.open(1, 3), P.open(2, 4)),
-    ])
+    @pytest.mark.parametrize('i1,i2,i3', CMP_TRIPLES)
     def test_equalities(self, i1, i2, i3):
         assert i1 == i1
         assert i1 != i2 and i2 != i1
@@ -332,10 +485,7 @@ class TestIntervalComparison:
 
         assert not i1 == 1
 
-    @pytest.mark.parametrize('i1,i2,i3', [
-        (P.closed(0, 1), P.closed(1, 2), P.closed(2, 3)),
-        (P.open(0, 2), P.open(1, 3), P.open(2, 4)),
-    ])
+    @pytest.mark.parametrize('i1,i2,i3', CMP_TRIPLES)
     def test_inequalities(self, i1, i2, i3):
         assert i1 < i3 and i3 > i1
         assert i1 <= i2 and i2 >= i1
@@ -365,125 +515,85 @@ class TestIntervalComparison:
         assert not i4 >= i5
         assert not i5 <= i4
 
-    def test_with_empty(self):
-        assert not (P.empty() < P.empty())
-        assert not (P.empty() <= P.empty())
-        assert not (P.empty() > P.empty())
-        assert not (P.empty() >= P.empty())
-
-        assert not (P.empty() < P.closed(2, 3))
-        assert not (P.empty() <= P.closed(2, 3))
-        assert not (P.empty() > P.closed(2, 3))
-        assert not (P.empty() >= P.closed(2, 3))
-
-        assert not (P.closed(2, 3) < P.empty())
-        assert not (P.closed(2, 3) > P.empty())
-        assert not (P.closed(2, 3) <= P.empty())
-        assert not (P.closed(2, 3) >= P.empty())
-
-    def test_with_empty_and_infinities(self):
-        assert not (P.empty() < P.closedopen(0, P.inf))
-        assert not (P.empty() <= P.closedopen(0, P.inf))
-        assert not (P.empty() > P.closedopen(0, P.inf))
-        assert not (P.empty() >= P.closedopen(0, P.inf))
-
-        assert not (P.closedopen(0, P.inf) < P.empty())
-        assert not (P.closedopen(0, P.inf) > P.empty())
-        assert not (P.closedopen(0, P.inf) <= P.empty())
-        assert not (P.closedopen(0, P.inf) >= P.empty())
-
-    def test_edge_cases(self):
-        assert not (P.closed(0, 2) >= P.open(0, 1))
-        assert not (P.closed(0, 2) >= P.openclosed(0, 1))
-
-    def test_with_values(self):
-        with pytest.deprecated_call():
-            assert 0 < P.closed(1, 2)
-
-        with pytest.deprecated_call():
-            assert not (0 < P.closed(-1, 1))
-
-        with pytest.deprecated_call():
-            assert not (0 < P.closed(0, 1))
-
-        with pytest.deprecated_call():
-            assert 0 < P.open(0, 1)
-            # assert 0 <= P.closed(1, 2)
-            # assert 0 <= P.open(0, 1)
-            # assert 0 <= P.closed(-1, 1)
-            # assert not (0 <= P.closed(-2, -1))
-            # assert not (0 <= P.open(-1, 0))
-
-        with pytest.deprecated_call():
-            assert P.closed(1, 2) > 0
-
-        with pytest.deprecated_call():
-            assert not (P.closed(-1, 1) > 0)
-
-        with pytest.deprecated_call():
-            assert not (P.closed(0, 1) > 0)
-
-        with pytest.deprecated_call():
-            assert P.open(0, 1) > 0
-
-        with pytest.deprecated_call():
-            assert P.closed(1, 2) >= 0
-
-        with pytest.deprecated_call():
-            assert P.open(0, 1) >= 0
-
-        with pytest.deprecated_call():
-            assert not (P.closed(-1, 1) >= 0)
-
-        with pytest.deprecated_call():
-            assert not (P.closed(-2, -1) >= 0)
-
-        with pytest.deprecated_call():
-            assert not (P.open(-1, 0) >= 0)
-
-        with pytest.deprecated_call():
-            assert not (0 < P.empty())
-
-        with pytest.deprecated_call():
-            assert not (0 <= P.empty())
-
-        with pytest.deprecated_call():
-            assert not (0 > P.empty())
-
-        with pytest.deprecated_call():
-            assert not (0 >= P.empty())
-
-        with pytest.deprecated_call():
-            assert not (P.empty() < 0)
-
-        with pytest.deprecated_call():
-            assert not (P.empty() <= 0)
-
-        with pytest.deprecated_call():
-            assert not (P.empty() > 0)
-
+    @pytest.mark.parametrize('i1,i2', [
+        (P.empty(), P.empty()),
+        (P.empty(), P.closed(2, 3)),
+        (P.closed(2, 3), P.empty()),
+    ])
+    def test_with_empty(self, i1, i2):
+        assert not (i1 < i2)
+        assert not (i1 <= i2)
+        assert not (i1 > i2)
+        assert not (i1 >= i2)
+
+    @pytest.mark.parametrize('i1,i2', [
+        (P.empty(), P.closedopen(0, P.inf)),
+        (P.closedopen(0, P.inf), P.empty()),
+    ])
+    def test_with_empty_and_infinities(self, i1, i2):
+        assert not (i1 < i2)
+        assert not (i1 <= i2)
+        assert not (i1 > i2)
+        assert not (i1 >= i2)
+
+    @pytest.mark.parametrize('i1,i2', [
+        (P.closed(0, 2), P.open(0, 1)),
+        (P.closed(0, 2), P.openclosed(0, 1)),
+    ])
+    def test_edge_cases(self, i1, i2):
+        assert not (i1 >= i2)
+
+    @pytest.mark.parametrize('op,x,y,expected', [
+        (operator.lt, 0, P.closed(1, 2), True),
+        (operator.lt, 0, P.closed(-1, 1), False),
+        (operator.lt, 0, P.closed(0, 1), False),
+        (operator.lt, 0, P.open(0, 1), True),
+        # (operator.le, 0, P.closed(1, 2), True),
+        # (operator.le, 0, P.open(0, 1), True),
+        # (operator.le, 0, P.closed(-1, 1), True),
+        # (operator.le, 0, P.closed(-2, -1), False),
+        # (operator.le, 0, P.open(-1, 0), False),
+        (operator.gt, P.closed(1, 2), 0, True),
+        (operator.gt, P.closed(-1, 1), 0, False),
+        (operator.gt, P.closed(0, 1), 0, False),
+        (operator.gt, P.open(0, 1), 0, True),
+        (operator.ge, P.closed(1, 2), 0, True),
+        (operator.ge, P.open(0, 1), 0, True),
+        (operator.ge, P.closed(-1, 1), 0, False),
+        (operator.ge, P.closed(-2, -1), 0, False),
+        (operator.ge, P.open(-1, 0), 0, False),
+        (operator.lt, 0, P.empty(), False),
+        (operator.le, 0, P.empty(), False),
+        (operator.gt, 0, P.empty(), False),
+        (operator.ge, 0, P.empty(), False),
+        (operator.lt, P.empty(), 0, False),
+        (operator.le, P.empty(), 0, False),
+        (operator.gt, P.empty(), 0, False),
+        (operator.ge, P.empty(), 0, False),
+    ])
+    def test_with_values(self, op, x, y, expected):
         with pytest.deprecated_call():
-            assert not (P.empty() >= 0)
+            assert op(x, y) is expected
 
 
 class TestIntervalContainment:
     def test_with_values(self):
-        assert 1 in P.closed(0, 2)
-        assert 1 in P.closed(1, 2)
-        assert 1 in P.closed(0, 1)
+        assert 1 in C02
+        assert 1 in C12
+        assert 1 in C01
 
-        assert 1 in P.open(0, 2)
-        assert 1 not in P.open(0, 1)
-        assert 1 not in P.open(1, 2)
+        assert 1 in O02
+        assert 1 not in O01
+        assert 1 not in O12
 
-        assert 1 in P.closed(0, 2) | P.closed(4, 6) | P.closed(8, 10)
-        assert 5 in P.closed(0, 2) | P.closed(4, 6) | P.closed(8, 10)
-        assert 10 in P.closed(0, 2) | P.closed(4, 6) | P.closed(8, 10)
+        assert 1 in C02_46_810
+        assert 5 in C02_46_810
+        assert 10 in C02_46_810
 
-        assert -1 not in P.closed(0, 2) | P.closed(4, 6) | P.closed(8, 10)
-        assert 3 not in P.closed(0, 2) | P.closed(4, 6) | P.closed(8, 10)
-        assert 7 not in P.closed(0, 2) | P.closed(4, 6) | P.closed(8, 10)
-        assert 11 not in P.closed(0, 2) | P.closed(4, 6) | P.closed(8, 10)
+        assert -1 not in C02_46_810
+        assert 3 not in C02_46_810
+        assert 7 not in C02_46_810
+        assert 11 not in C02_46_810
 
     def test_with_infinities(self):
         assert 1 in P.closed(-P.inf, P.inf)
@@ -502,6 +612,15 @@ class TestIntervalContainment:
         assert P.inf not in P.empty()
         assert -P.inf not in P.empty()
 
+    def test_with_many_atomics_and_open_bounds(self):
+        i = P.Interval(*[P.closedopen(x, x + 1) if x % 2 else P.open(x, x + 1) for x in range(0, 100, 3)])
+
+        for x in range(0, 100, 3):
+            assert (x in i) == (x % 2 == 1)
+            assert x + 0.5 in i
+            assert x + 1 not in i
+            assert x + 2 not in i
+
     def test_with_intervals(self):
         assert P.closed(1, 2) in P.closed(0, 3)
         assert P.closed(1, 2) in P.closed(1, 2)
@@ -519,6 +638,22 @@ class TestIntervalContainment:
         assert P.closed(5, 6) not in P.closed(1, 2) | P.closed(3, 4)
         assert P.singleton(0) | P.singleton(6) not in P.closed(0, 1) | P.closed(4, 5)
 
+    def test_with_many_atomics(self):
+        i = P.Interval(*[P.closed(x, x + 2) for x in range(0, 3000, 3)])
+
+        assert P.Interval(*[P.open(x, x + 2) for x in range(0, 3000, 6)]) in i
+        assert P.Interval(*[P.singleton(x + 1) for x in range(0, 3000, 3)]) in i
+        assert P.Interval(*[P.closed(x, x + 2) for x in range(0, 3000, 3)]) | P.singleton(3000) not in i
+        assert P.Interval(*[P.closed(x, x + 2) for x in range(0, 3000, 3)]) | P.singleton(1502.5) not in i
+        assert P.open(-P.inf, P.inf) not in P.empty()
+
+    def test_with_many_atomics_and_values(self):
+        i = P.Interval(*[P.closed(2 * x, 2 * x + 1) for x in range(10000)])
+        assert all(x in i for x in range(0, 20000, 2))
+        assert not any(x + 0.5 in i for x in range(1, 20000, 2))
+        assert -1 not in i
+        assert 20000 not in i
+
     def test_with_unions(self):
         assert P.closed(0, 1) | P.closed(2, 3) in P.closed(0, 4)
         assert P.closed(0, 1) | P.closed(2, 3) in P.closed(0, 1) | P.closed(2, 3)
@@ -567,9 +702,9 @@ class TestIntervalIntersection:
         assert P.open(0, 3) & P.closed(2, 4) == P.closedopen(2, 3)
 
     def test_with_union(self):
-        assert (P.closed(0, 2) | P.closed(4, 6)) & (P.closed(0, 1) | P.closed(4, 5)) == P.closed(0, 1) | P.closed(4, 5)
-        assert (P.closed(0, 2) | P.closed(4, 6)) & (P.closed(-1, 1) | P.closed(3, 6)) == P.closed(0, 1) | P.closed(4, 6)
-        assert (P.closed(0, 2) | P.closed(4, 6)) & (P.closed(1, 4) | P.singleton(5)) == P.closed(1, 2) | P.singleton(4) | P.singleton(5)
+        assert C02_46 & (C01 | P.closed(4, 5)) == P.closed(0, 1) | P.closed(4, 5)
+        assert C02_46 & (P.closed(-1, 1) | P.closed(3, 6)) == P.closed(0, 1) | P.closed(4, 6)
+        assert C02_46 & (P.closed(1, 4) | P.singleton(5)) == P.closed(1, 2) | P.singleton(4) | P.singleton(5)
 
     def test_empty(self):
         assert (P.closed(0, 1) & P.closed(2, 3)).empty
@@ -620,51 +755,73 @@ class TestIntervalUnion:
         assert (P.closed(0, 1) | P.closed(2, 3) | P.closed(1, 2)).atomic
         assert P.closed(0, 1) | P.closed(2, 3) | P.closed(1, 2) == P.closed(0, 3)
 
+    @pytest.mark.parametrize('bounds', [range(0, 30000, 3), range(30000, 0, -3)])
+    def test_with_many_disjoint(self, bounds):
+        i = P.empty()
+        for x in bounds:
+            i = i | P.closedopen(x, x + 1)
+        assert len(i) == len(bounds)
+        assert i == P.Interval(*[P.closedopen(x, x + 1) for x in bounds])
+        assert list(i) == sorted(i, key=lambda a: a.lower)
+
+    @pytest.mark.parametrize('bounds', [range(0, 30000, 3), range(30000, 0, -3)])
+    def test_with_many_adjacent(self, bounds):
+        i = P.empty()
+        for x in bounds:
+            i = i | P.closedopen(x, x + 3)
+        assert i == P.closedopen(min(bounds), max(bounds) + 3)
+
     def test_with_empty(self):
         assert P.closed(0, 1) | P.empty() == P.closed(0, 1)
+        assert P.empty() | P.closed(0, 1) == P.closed(0, 1)
+        assert P.empty() | P.empty() == P.empty()
+
+        i = P.closed(0, 1)
+        assert i | P.empty() is i
+        assert P.empty() | i is i
 
     def test_issue_12(self):
         # https://github.com/AlexandreDecan/python-intervals/issues/12
-        assert P.open(0, 2) | P.closed(0, 2) == P.closed(0, 2)
-        assert P.open(0, 2) | P.closed(1, 2) == P.openclosed(0, 2)
-        assert P.open(0, 2) | P.closed(0, 1) == P.closedopen(0, 2)
+        assert O02 | C02 == P.closed(0, 2)
+        assert O02 | C12 == P.openclosed(0, 2)
+        assert O02 | C01 == P.closedopen(0, 2)
 
-        assert P.closed(0, 2) | P.open(0, 2) == P.closed(0, 2)
-        assert P.closed(1, 2) | P.open(0, 2) == P.openclosed(0, 2)
-        assert P.closed(0, 1) | P.open(0, 2) == P.closedopen(0, 2)
+        assert C02 | O02 == P.closed(0, 2)
+        assert C12 | O02 == P.openclosed(0, 2)
+        assert C01 | O02 == P.closedopen(0, 2)
 
-        assert P.closed(0, 2) | P.singleton(2) == P.closed(0, 2)
-        assert P.closedopen(0, 2) | P.singleton(2) == P.closed(0, 2)
-        assert P.openclosed(0, 2) | P.singleton(2) == P.openclosed(0, 2)
-        assert P.openclosed(0, 2) | P.singleton(0) == P.closed(0, 2)
+        assert C02 | S2 == P.closed(0, 2)
+        assert CO02 | S2 == P.closed(0, 2)
+        assert OC02 | S2 == P.openclosed(0, 2)
+        assert OC02 | S0 == P.closed(0, 2)
 
-        assert P.singleton(2) | P.closed(0, 2) == P.closed(0, 2)
-        assert P.singleton(2) | P.closedopen(0, 2) == P.closed(0, 2)
-        assert P.singleton(2) | P.openclosed(0, 2) == P.openclosed(0, 2)
-        assert P.singleton(0) | P.openclosed(0, 2) == P.closed(0, 2)
+        assert S2 | C02 == P.closed(0, 2)
+        assert S2 | CO02 == P.closed(0, 2)
+        assert S2 | OC02 == P.openclosed(0, 2)
+        assert S0 | OC02 == P.closed(0, 2)
 
     def test_issue_13(self):
         # https://github.com/AlexandreDecan/python-intervals/issues/13
-        assert P.closed(1, 1) | P.openclosed(1, 2) == P.closed(1, 2)
-        assert P.openclosed(1, 2) | P.closed(1, 1) == P.closed(1, 2)
-        assert P.closed(0, 1) | P.openclosed(1, 2) == P.closed(0, 2)
-        assert P.openclosed(1, 2) | P.closed(0, 1) == P.closed(0, 2)
+        assert C11 | OC12 == P.closed(1, 2)
+        assert OC12 | C11 == P.closed(1, 2)
+        assert C01 | OC12 == P.closed(0, 2)
+        assert OC12 | C01 == P.closed(0, 2)
 
-        assert P.openclosed(1, 2) | P.closed(1, 1) == P.closed(1, 2)
-        assert P.closed(1, 1) | P.openclosed(1, 2) == P.closed(1, 2)
-        assert P.openclosed(1, 2) | P.closed(0, 1) == P.closed(0, 2)
-        assert P.closed(0, 1) | P.openclosed(1, 2) == P.closed(0, 2)
+        assert OC12 | C11 == P.closed(1, 2)
+        assert C11 | OC12 == P.closed(1, 2)
+        assert OC12 | C01 == P.closed(0, 2)
+        assert C01 | OC12 == P.closed(0, 2)
 
     def test_issue_38(self):
         # https://github.com/AlexandreDecan/portion/issues/38
-        assert P.open(1, 2) | P.open(2, 3) | P.singleton(2) == P.open(1, 3)
-        assert P.open(2, 3) | P.open(1, 2) | P.singleton(2) == P.open(1, 3)
+        assert O12 | O23 | S2 == P.open(1, 3)
+        assert O23 | O12 | S2 == P.open(1, 3)
 
-        assert P.open(1, 2) | P.singleton(2) | P.open(2, 3) == P.open(1, 3)
-        assert P.open(2, 3) | P.singleton(2) | P.open(1, 2) == P.open(1, 3)
+        assert O12 | S2 | O23 == P.open(1, 3)
+        assert O23 | S2 | O12 == P.open(1, 3)
 
-        assert P.singleton(2) | P.open(2, 3) | P.open(1, 2) == P.open(1, 3)
-        assert P.singleton(2) | P.open(1, 2) | P.open(2, 3) == P.open(1, 3)
+        assert S2 | O23 | O12 == P.open(1, 3)
+        assert S2 | O12 | O23 == P.open(1, 3)
 
     def test_proxy_method(self):
         i1, i2 = P.closed(0, 1), P.closed(2, 3)
@@ -688,11 +845,34 @@ class TestIntervalComplement:
         assert ~(P.singleton(0) | P.singleton(5) | P.singleton(10)) == P.open(-P.inf, 0) | P.open(0, 5) | P.open(5, 10) | P.open(10, P.inf)
         assert ~(P.open(0, 1) | P.closed(2, 3) | P.open(4, 5)) == P.openclosed(-P.inf, 0) | P.closedopen(1, 2) | P.openclosed(3, 4) | P.closedopen(5, P.inf)
 
-    @pytest.mark.parametrize('i', [P.closed(0, 1), P.open(0, 1), P.openclosed(0, 1), P.closedopen(0, 1)])
+    def test_with_shared_instances(self):
+        # from_atomic can return shared instances, which should not be modified
+        class CachedInterval(P.Interval):
+            _cache = {}
+
+            @classmethod
+            def from_atomic(cls, *args):
+                if args not in cls._cache:
+                    cls._cache[args] = super().from_atomic(*args)
+                return cls._cache[args]
+
+        i = CachedInterval.from_atomic(P.CLOSED, 0, 1, P.CLOSED) | CachedInterval.from_atomic(P.CLOSED, 2, 3, P.CLOSED)
+        assert ~i == P.open(-P.inf, 0) | P.open(1, 2) | P.open(3, P.inf)
+        assert CachedInterval.from_atomic(P.OPEN, -P.inf, 0, P.OPEN) == P.open(-P.inf, 0)
+
+    @pytest.mark.parametrize('i', IDENTITY_INTERVALS, ids=IDENTITY_IDS)
     def test_identity(self, i):
         for interval in i:
             assert ~(~interval) == interval
 
+    @pytest.mark.parametrize('n', [1, 10, 1000])
+    def test_identity_with_many_atomics(self, n):
+        i = P.Interval(*[P.closedopen(x, x + 1) if x % 2 else P.open(x, x + 1) for x in range(0, 3 * n, 3)])
+        assert len(~i) == n + 1
+        assert ~(~i) == i
+        assert (i | ~i) == P.open(-P.inf, P.inf)
+        assert (i & ~i).empty
+
     def test_empty(self):
         assert ~P.open(1, 1) == P.open(-P.inf, P.inf)
         assert (~P.closed(-P.inf, P.inf)).empty
@@ -705,7 +885,7 @@ class TestIntervalComplement:
 
 
 class TestIntervalDifference:
-    @pytest.mark.parametrize('i', [P.closed(0, 1), P.open(0, 1), P.openclosed(0, 1), P.closedopen(0, 1), P.empty(), P.singleton(0)])
+    @pytest.mark.parametrize('i', IDENTITY_INTERVALS + (P.empty(), S0), ids=IDENTITY_IDS + ('empty', 'singleton'))
     def test_with_itself(self, i):
         assert i - i == P.empty()
 
@@ -733,6 +913,12 @@ class TestIntervalDifference:
         assert P.closed(0, 2) - P.closed(-2, 1) == P.openclosed(1, 2)
         assert P.closed(0, 2) - P.open(-2, 1) == P.closed(1, 2)
 
+    def test_with_unions(self):
+        assert (P.closed(0, 4) | P.closed(6, 10)) - (P.open(1, 2) | P.closed(3, 7)) == P.closed(0, 1) | P.closedopen(2, 3) | P.openclosed(7, 10)
+        assert P.closed(0, 10) - (P.singleton(2) | P.singleton(5)) == P.closedopen(0, 2) | P.open(2, 5) | P.openclosed(5, 10)
+        assert (P.closed(0, 1) | P.closed(2, 3)) - P.closed(0, 3) == P.empty()
+        assert (P.closed(0, 1) | P.closed(2, 3)) - P.open(1, 2) == P.closed(0, 1) | P.closed(2, 3)
+
     def test_proxy_method(self):
         i1, i2 = P.closed(0, 1), P.closed(2, 3)
         assert i1 - i2 == i1.difference(i2)
@@ -772,13 +958,19 @@ class TestIntervalIteration:
         assert interval[::-1] == P.Interval(*items[::-1])
         assert interval[::2] == P.Interval(*items[::2])
 
+        assert interval[:] is not interval
+        assert interval[:] == interval
+        assert list(interval[::-1]) == items
+        assert interval[3:] == P.empty()
+
     def test_missing_index(self):
         i1 = P.closed(10, 10) | P.closed(5, 6) | P.closed(7, 8) | P.closed(8, 9)
         with pytest.raises(IndexError):
             i1[3]
 
     def test_empty(self):
-        assert len(P.empty()) == 0
-        assert list(P.empty()) == []
+        e = P.empty()
+        assert len(e) == 0
+        assert list(e) == []
         with pytest.raises(IndexError):
-            P.empty()[0]
+            e[0]
@@ -3,12 +3,76 @@ import pytest
 import portion as P
 
 
+# Intervals are immutable, so they can be shared by all tests of this module
+CANONICAL = (P.closed(0, 1), P.openclosed(0, 1), P.closedopen(0, 1), P.open(0, 1))
+CANONICAL_IDS = ('closed', 'openclosed', 'closedopen', 'open')
+
+# Intervals whose string and data representations should be parsed back
+IDENTITY = CANONICAL + (
+    P.singleton(0),
+    P.closed(-5, -1) | P.closed(3, 7),
+    P.open(0, 1) | P.singleton(2) | P.openclosed(3, 4),
+    P.closed(0, 1) | P.closed(2, 3) | P.closed(4, 5) | P.closed(6, 7),
+    P.openclosed(-P.inf, 0),
+    P.closedopen(0, P.inf),
+    P.open(-P.inf, 0) | P.open(0, P.inf),
+    P.open(-P.inf, P.inf),
+    P.empty(),
+)
+IDENTITY_IDS = CANONICAL_IDS + (
+    'singleton',
+    'union',
+    'mixed-union',
+    'long-union',
+    'left-infinite',
+    'right-infinite',
+    'infinite-union',
+    'infinite',
+    'empty',
+)
+
+
+def _quote(s):
+    return '"' + str(s) + '"'
+
+
+@pytest.fixture(scope='module')
+def to_string_params():
+    return {
+        'disj': ' or ',
+        'sep': '-',
+        'left_open': '<!',
+        'left_closed': '<',
+        'right_open': '!>',
+        'right_closed': '>',
+        'conv': _quote,
+        'pinf': '+oo',
+        'ninf': '-oo',
+    }
+
+
+@pytest.fixture(scope='module')
+def from_string_params():
+    return {
+        'conv': lambda s: int(s[1:-1]),
+        'disj': ' or ',
+        'sep': '-',
+        'left_open': '<!',
+        'left_closed': '<',
+        'right_open': '!>',
+        'right_closed': '>',
+        'pinf': r'\+oo',
+        'ninf': '-oo',
+    }
+
+
 class TestToString:
     def test_bounds(self):
-        assert P.to_string(P.closed(0, 1)) == '[0,1]'
-        assert P.to_string(P.openclosed(0, 1)) == '(0,1]'
-        assert P.to_string(P.closedopen(0, 1)) == '[0,1)'
-        assert P.to_string(P.open(0, 1)) == '(0,1)'
+        i1, i2, i3, i4 = CANONICAL
+        assert P.to_string(i1) == '[0,1]'
+        assert P.to_string(i2) == '(0,1]'
+        assert P.to_string(i3) == '[0,1)'
+        assert P.to_string(i4) == '(0,1)'
 
     def test_singleton(self):
         assert P.to_string(P.singleton(0)) == '[0]'
@@ -27,40 +91,35 @@ class TestToString:
         assert P.to_string(P.closed('a', 'b')) == "['a','b']"
         assert P.to_string(P.closed(tuple([0]), tuple([1]))) == '[(0,),(1,)]'
 
-    def test_parameters(self):
-        i1, i2, i3, i4 = P.closed(0, 1), P.openclosed(0, 1), P.closedopen(0, 1), P.open(0, 1)
-        params = {
-            'disj': ' or ',
-            'sep': '-',
-            'left_open': '<!',
-            'left_closed': '<',
-            'right_open': '!>',
-            'right_closed': '>',
-            'conv': lambda s: '"{}"'.format(s),
-            'pinf': '+oo',
-            'ninf': '-oo',
-        }
+    def test_conv_returns_strings(self):
+        with pytest.raises(TypeError):
+            P.to_string(P.closed(1, 2), conv=lambda v: v)
+        with pytest.raises(TypeError):
+            P.to_string(P.singleton(1), conv=lambda v: v)
 
-        assert P.to_string(i1, **params) == '<"0"-"1">'
-        assert P.to_string(i2, **params) == '<!"0"-"1">'
-        assert P.to_string(i3, **params) == '<"0"-"1"!>'
-        assert P.to_string(i4, **params) == '<!"0"-"1"!>'
+    def test_parameters(self, to_string_params):
+        i1, i2, i3, i4 = CANONICAL
+        assert P.to_string(i1, **to_string_params) == '<"0"-"1">'
+        assert P.to_string(i2, **to_string_params) == '<!"0"-"1">'
+        assert P.to_string(i3, **to_string_params) == '<"0"-"1"!>'
+        assert P.to_string(i4, **to_string_params) == '<!"0"-"1"!>'
 
-        assert P.to_string(P.empty(), **params) == '<!!>'
-        assert P.to_string(P.singleton(1), **params) == '<"1">'
+        assert P.to_string(P.empty(), **to_string_params) == '<!!>'
+        assert P.to_string(P.singleton(1), **to_string_params) == '<"1">'
 
-        assert P.to_string(P.openclosed(-P.inf, 1), **params) == '<!-oo-"1">'
-        assert P.to_string(P.closedopen(1, P.inf), **params) == '<"1"-+oo!>'
+        assert P.to_string(P.openclosed(-P.inf, 1), **to_string_params) == '<!-oo-"1">'
+        assert P.to_string(P.closedopen(1, P.inf), **to_string_params) == '<"1"-+oo!>'
 
-        assert P.to_string(P.closed(0, 1) | P.closed(2, 3), **params) == '<"0"-"1"> or <"2"-"3">'
+        assert P.to_string(P.closed(0, 1) | P.closed(2, 3), **to_string_params) == '<"0"-"1"> or <"2"-"3">'
 
 
 class TestFromString:
     def test_bounds(self):
-        assert P.from_string('[0,1]', int) == P.closed(0, 1)
-        assert P.from_string('(0,1]', int) == P.openclosed(0, 1)
-        assert P.from_string('[0,1)', int) == P.closedopen(0, 1)
-        assert P.from_string('(0,1)', int) == P.open(0, 1)
+        i1, i2, i3, i4 = CANONICAL
+        assert P.from_string('[0,1]', int) == i1
+        assert P.from_string('(0,1]', int) == i2
+        assert P.from_string('[0,1)', int) == i3
+        assert P.from_string('(0,1)', int) == i4
 
     def test_singleton(self):
         assert P.from_string('[0]', int) == P.singleton(0)
@@ -75,72 +134,71 @@ class TestFromString:
     def test_unions(self):
         assert P.from_string('[0,1] | [2,3]', int) == P.closed(0, 1) | P.closed(2, 3)
 
+    def test_many_unions(self):
+        i = P.Interval(*[P.closed(x, x + 1) for x in range(0, 3000, 3)])
+        assert P.from_string(' | '.join('[{},{}]'.format(x, x + 1) for x in range(0, 3000, 3)), int) == i
+
+    def test_anchored_patterns(self):
+        # Patterns are matched against the remaining part of the string
+        i = P.closed(1, 2) | P.closed(3, 4)
+        assert P.from_string('[1,2] | [3,4]', int, disj=r'^ \| ') == i
+        assert P.from_string('[1,2] | [3,4]', int, left_closed=r'^\[') == i
+        assert P.from_string('[1,2] | (3,4)', int, left_open=r'(?<!\])\(') == P.closed(1, 2) | P.open(3, 4)
+
     def test_conv_is_required(self):
         with pytest.raises(Exception):
             P.from_string('[1,2]', None)
 
-    def test_parameters(self):
-        i1, i2, i3, i4 = '<"0"-"1">', '<!"0"-"1">', '<"0"-"1"!>', '<!"0"-"1"!>'
-        params = {
-            'conv': lambda s: int(s[1:-1]),
-            'disj': ' or ',
-            'sep': '-',
-            'left_open': '<!',
-            'left_closed': '<',
-            'right_open': '!>',
-            'right_closed': '>',
-            'pinf': r'\+oo',
-            'ninf': '-oo',
-        }
-
-        assert P.from_string(i1, **params) == P.closed(0, 1)
-        assert P.from_string(i2, **params) == P.openclosed(0, 1)
-        assert P.from_string(i3, **params) == P.closedopen(0, 1)
-        assert P.from_string(i4, **params) == P.open(0, 1)
-
-        assert P.from_string('<!!>', **params) == P.empty()
-        assert P.from_string('<"1">', **params) == P.singleton(1)
-
-        assert P.from_string('<!-oo-"1">', **params) == P.openclosed(-P.inf, 1)
-        assert P.from_string('<"1"-+oo!>', **params) == P.closedopen(1, P.inf)
-
-        assert P.from_string('<"0"-"1"> or <"2"-"3">', **params) == P.closed(0, 1) | P.closed(2, 3)
-
-    @pytest.mark.parametrize('case', [
-        ' ',
-        '1',
-        '[1',
-        '1)',
-        ')1,2]',
-        '|',
-        '[0,1] | ',
-        '[0,1] | 1',
-        '1 | [0,1]',
-        '[0,1] | 1 | [2,3]',
-        '[0,1] || [2,3]',
-    ])
-    def test_invalid_strings(self, case):
+    def test_parameters(self, from_string_params):
+        s1, s2, s3, s4 = '<"0"-"1">', '<!"0"-"1">', '<"0"-"1"!>', '<!"0"-"1"!>'
+        i1, i2, i3, i4 = CANONICAL
+        assert P.from_string(s1, **from_string_params) == i1
+        assert P.from_string(s2, **from_string_params) == i2
+        assert P.from_string(s3, **from_string_params) == i3
+        assert P.from_string(s4, **from_string_params) == i4
+
+        assert P.from_string('<!!>', **from_string_params) == P.empty()
+        assert P.from_string('<"1">', **from_string_params) == P.singleton(1)
+
+        assert P.from_string('<!-oo-"1">', **from_string_params) == P.openclosed(-P.inf, 1)
+        assert P.from_string('<"1"-+oo!>', **from_string_params) == P.closedopen(1, P.inf)
+
+        assert P.from_string('<"0"-"1"> or <"2"-"3">', **from_string_params) == P.closed(0, 1) | P.closed(2, 3)
+
+    def test_invalid_strings(self):
         # Related to https://github.com/AlexandreDecan/portion/issues/57
-        with pytest.raises(ValueError):
-            P.from_string(case, int)
+        cases = [
+            ' ',
+            '1',
+            '[1',
+            '1)',
+            ')1,2]',
+            '|',
+            '[0,1] | ',
+            '[0,1] | 1',
+            '1 | [0,1]',
+            '[0,1] | 1 | [2,3]',
+            '[0,1] || [2,3]',
+        ]
+
+        for case in cases:
+            with pytest.raises(ValueError):
+                P.from_string(case, int)
 
 
 class TestStringIdentity:
-    def test_identity(self):
-        i1, i2, i3, i4 = P.closed(0, 1), P.openclosed(0, 1), P.closedopen(0, 1), P.open(0, 1)
-
-        assert P.from_string(P.to_string(i1), int) == i1
-        assert P.from_string(P.to_string(i2), int) == i2
-        assert P.from_string(P.to_string(i3), int) == i3
-        assert P.from_string(P.to_string(i4), int) == i4
+    @pytest.mark.parametrize('i', IDENTITY, ids=IDENTITY_IDS)
+    def test_identity(self, i):
+        assert P.from_string(P.to_string(i), int) == i
 
 
 class TestToData:
     def test_bounds(self):
-        assert P.to_data(P.closed(0, 1)) == [(True, 0, 1, True)]
-        assert P.to_data(P.openclosed(0, 1)) == [(False, 0, 1, True)]
-        assert P.to_data(P.closedopen(0, 1)) == [(True, 0, 1, False)]
-        assert P.to_data(P.open(0, 1)) == [(False, 0, 1, False)]
+        i1, i2, i3, i4 = CANONICAL
+        assert P.to_data(i1) == [(True, 0, 1, True)]
+        assert P.to_data(i2) == [(False, 0, 1, True)]
+        assert P.to_data(i3) == [(True, 0, 1, False)]
+        assert P.to_data(i4) == [(False, 0, 1, False)]
 
     def test_values(self):
         assert P.to_data(P.closed('a', 'b')) == [(True, 'a', 'b', True)]
@@ -168,10 +226,22 @@ class TestToData:
 
 class TestFromData:
     def test_bounds(self):
-        assert P.from_data([(P.CLOSED, 0, 1, P.CLOSED)]) == P.closed(0, 1)
-        assert P.from_data([(P.OPEN, 0, 1, P.CLOSED)]) == P.openclosed(0, 1)
-        assert P.from_data([(P.CLOSED, 0, 1, P.OPEN)]) == P.closedopen(0, 1)
-        assert P.from_data([(P.OPEN, 0, 1, P.OPEN)]) == P.open(0, 1)
+        i1, i2, i3, i4 = CANONICAL
+        assert P.from_data([(P.CLOSED, 0, 1, P.CLOSED)]) == i1
+        assert P.from_data([(P.OPEN, 0, 1, P.CLOSED)]) == i2
+        assert P.from_data([(P.CLOSED, 0, 1, P.OPEN)]) == i3
+        assert P.from_data([(P.OPEN, 0, 1, P.OPEN)]) == i4
+
+    def test_bound_values(self):
+        i1, i2, i3, i4 = CANONICAL
+        assert P.from_data([(True, 0, 1, True)]) == i1
+        assert P.from_data([(False, 0, 1, True)]) == i2
+        assert P.from_data([(1, 0, 1, 0)]) == i3
+
+        with pytest.raises(ValueError):
+            P.from_data([(2, 0, 1, True)])
+        with pytest.raises(ValueError):
+            P.from_data([([True], 0, 1, True)])
 
     def test_values(self):
         assert P.from_data([(P.CLOSED, 'a', 'b', P.CLOSED)]) == P.closed('a', 'b')
@@ -199,10 +269,6 @@ class TestFromData:
 
 
 class TestDataIdentity:
-    def test_identity(self):
-        i1, i2, i3, i4 = P.closed(0, 1), P.openclosed(0, 1), P.closedopen(0, 1), P.open(0, 1)
-
-        assert P.from_data(P.to_data(i2)) == i2
-        assert P.from_data(P.to_data(i3)) == i3
-        assert P.from_data(P.to_data(i4)) == i4
-        assert P.from_data(P.to_data(i1)) == i1
+    @pytest.mark.parametrize('i', IDENTITY, ids=IDENTITY_IDS)
+    def test_identity(self, i):
+        assert P.from_data(P.to_data(i)) == i